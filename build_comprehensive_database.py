@@ -21,6 +21,15 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 from src.logging_config import setup_logging
 import logging
 
+# Condition suffix, e.g. "(Field-Tested)"
+_CONDITION_RE = re.compile(r'\(([^)]+)\)$')
+
+# Stickers, cases, keys, etc. are matched in a single regex scan
+_SKIP_KEYWORDS_RE = re.compile('|'.join(map(re.escape, [
+    'Sticker |', 'Case', 'Key', 'Pin', 'Patch', 'Graffiti',
+    'Music Kit', 'Capsule', 'Package', 'Coupon', 'Gift'
+])))
+
 class ComprehensiveDatabaseBuilder:
     """Builds comprehensive CS2 skin database from PriceEmpire API"""
     
@@ -44,6 +53,11 @@ class ComprehensiveDatabaseBuilder:
             'shotguns': ['Nova', 'XM1014', 'Sawed-Off', 'MAG-7'],
             'lmgs': ['M249', 'Negev']
         }
+        self._weapon_to_category = {
+            weapon: category
+            for category, weapons in self.weapon_categories.items()
+            for weapon in weapons
+        }
         
         # Float condition mappings
         self.float_conditions = {
@@ -195,7 +209,7 @@ class ComprehensiveDatabaseBuilder:
             name = name[9:]  # Remove "Souvenir "
         
         # Extract condition (in parentheses at the end)
-        condition_match = re.search(r'\(([^)]+)\)$', name)
+        condition_match = _CONDITION_RE.search(name)
         if condition_match:
             result['condition_name'] = condition_match.group(1)
             name = name[:condition_match.start()].strip()
@@ -214,10 +228,7 @@ class ComprehensiveDatabaseBuilder:
 
     def get_weapon_category(self, weapon_name: str) -> str:
         """Determine weapon category from weapon name"""
-        for category, weapons in self.weapon_categories.items():
-            if weapon_name in weapons:
-                return category
-        return 'other'    
+        return self._weapon_to_category.get(weapon_name, 'other')
         
     def get_float_range(self, condition_name: str) -> Tuple[float, float]:
         """Get float range for a condition"""
@@ -290,12 +301,7 @@ class ComprehensiveDatabaseBuilder:
                 continue
                 
             # Skip stickers, cases, keys, etc.
-            skip_keywords = [
-                'Sticker |', 'Case', 'Key', 'Pin', 'Patch', 'Graffiti',
-                'Music Kit', 'Capsule', 'Package', 'Coupon', 'Gift'
-            ]
-            
-            if any(keyword in market_hash_name for keyword in skip_keywords):
+            if _SKIP_KEYWORDS_RE.search(market_hash_name):
                 continue
             
             # Parse the skin name
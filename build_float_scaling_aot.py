@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-time build of the float scaling kernel
+Compiles src/float_scaling_numba.py's scale_float into the _float_scaling_aot
+extension next to it, which float_scaling_numba imports in place of the JIT
+version. Re-run after changing the kernel.
+"""
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Importing the module here JIT-compiles its other kernels under the top-level
+# module name; keep those out of the cache the package itself loads from
+os.environ['NUMBA_CACHE_DIR'] = tempfile.mkdtemp(prefix='csta_numba_')
+
+# Import the kernel module directly so the build doesn't need the package's config
+SRC_DIR = Path(__file__).parent / 'src'
+sys.path.insert(0, str(SRC_DIR))
+
+from numba.pycc import CC
+from float_scaling_numba import _scale_float, SCALE_FLOAT_SIGNATURE
+
+def main():
+    cc = CC('_float_scaling_aot')
+    cc.output_dir = str(SRC_DIR)
+    cc.export('scale_float', SCALE_FLOAT_SIGNATURE)(_scale_float)
+    cc.compile()
+    print(f"✅ Built {cc.output_file} in {SRC_DIR}")
+
+if __name__ == "__main__":
+    main()
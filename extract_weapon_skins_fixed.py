@@ -410,7 +410,7 @@ def generate_mapping_code(weapon_skins: Dict[str, List[str]]):
         for skin in skins:
             # Use placeholder collection and rarity - these need to be filled in manually
             skin_key = f"{weapon} | {skin}"
-            mapping_lines.append(f'    "{skin_key}": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),')
+            mapping_lines.append(f'    "{skin_key}": _UNK,')
     
     return '\n'.join(mapping_lines)
 
@@ -452,9 +452,30 @@ async def main():
 # Total weapons: {len(weapon_counts)}
 # Total unique skins: {sum(len(set(skins)) for skins in weapon_skins.values())}
 
+import sys
+from collections import defaultdict
+
+# Shared placeholder for skins whose collection and rarity are not filled in yet
+_UNK = ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY")
+
 WEAPON_SKIN_MAPPINGS = {{
 {mapping_code}
 }}
+
+# Derived lookups, built once at import. Names are interned so lookups with interned names
+# (sys.intern(raw_name)) hit on identity instead of comparing the full strings
+WEAPON_SKIN_MAPPINGS = {{sys.intern(name): info for name, info in WEAPON_SKIN_MAPPINGS.items()}}
+KNOWN_SKINS = frozenset(WEAPON_SKIN_MAPPINGS)  # for "is this a known skin?" checks
+SKIN_TO_WEAPON = {{name: sys.intern(name.split(' | ', 1)[0]) for name in WEAPON_SKIN_MAPPINGS}}
+
+# Inverted inside a function so no loop variables leak into the module (even when empty)
+def _group_by_weapon(skin_to_weapon):
+    weapon_to_skins = defaultdict(list)
+    for name, weapon in skin_to_weapon.items():
+        weapon_to_skins[weapon].append(name)
+    return {{weapon: tuple(names) for weapon, names in weapon_to_skins.items()}}
+
+WEAPON_TO_SKINS = _group_by_weapon(SKIN_TO_WEAPON)
 """)
     
     print(f"\n💾 Mapping code saved to: {output_file}")
@@ -0,0 +1,27 @@
+"""
+Event loop setup for the CS2 Trade-up Calculator scripts.
+run() switches asyncio to uvloop (winloop on Windows) when it is installed,
+otherwise keeps the default loop, and then runs the given coroutine.
+"""
+
+import asyncio
+import sys
+
+def install_fast_event_loop() -> bool:
+    """Install uvloop/winloop as the asyncio event loop policy if available"""
+    try:
+        if sys.platform == 'win32':
+            import winloop as loop_impl
+        else:
+            import uvloop as loop_impl
+    except ImportError:
+        return False
+
+    loop_impl.install()
+    return True
+
+def run(main):
+    """asyncio.run(main) on the fastest available event loop"""
+    install_fast_event_loop()
+    return asyncio.run(main)
+
@@ -23,9 +23,23 @@ class ComprehensiveDatabaseManager:
         self.db_path = db_path or Path("data/comprehensive_skins.db")
         if not Path(self.db_path).exists():
             raise FileNotFoundError(f"Comprehensive database not found at {self.db_path}")
+        
+        # Per-name lookup caches (None = known missing); writes through this manager keep them in sync
+        self._skin_cache: Dict[str, Optional[Dict]] = {}
+        self._validation_cache: Dict[str, Optional[Dict]] = {}
+    
+    def refresh(self):
+        """Drop the cached skin and validation lookups so the next calls re-read the database"""
+        self._skin_cache.clear()
+        self._validation_cache.clear()
     
-    def get_all_tradeable_skins(self) -> List[Dict]:
-        """Get all skins that can be used in trade-ups (Consumer to Classified)"""
+    def get_all_tradeable_skins(self, rarity: Optional[str] = None, collection: Optional[str] = None,
+                                limit: Optional[int] = None) -> List[Dict]:
+        """Get all skins that can be used in trade-ups (Consumer to Classified)
+        
+        rarity, collection and limit are applied in SQL (rarity and collection are indexed)
+        so callers that only need a slice don't materialize the whole table.
+        """
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
@@ -39,6 +53,15 @@ class ComprehensiveDatabaseManager:
             'Classified'
         ]
         
+        params = list(tradeable_rarities)
+        filters = ""
+        if rarity is not None:
+            filters += " AND rarity = ?"
+            params.append(rarity)
+        if collection is not None:
+            filters += " AND collection = ?"
+            params.append(collection)
+        
         placeholders = ','.join(['?' for _ in tradeable_rarities])        
         query = f"""
             SELECT 
@@ -49,11 +72,14 @@ class ComprehensiveDatabaseManager:
             WHERE rarity IN ({placeholders})
             AND weapon_name IS NOT NULL
             AND skin_name IS NOT NULL
-            AND souvenir = 0
+            AND souvenir = 0{filters}
             ORDER BY weapon_name, rarity, condition_name
         """
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
         
-        cursor.execute(query, tradeable_rarities)
+        cursor.execute(query, params)
         results = cursor.fetchall()
         conn.close()
         
@@ -181,8 +207,16 @@ class ComprehensiveDatabaseManager:
         conn.close()
         return stats
     
+    def _forget(self, market_hash_name: str):
+        """Evict a skin's cached lookups after its row was written"""
+        self._skin_cache.pop(market_hash_name, None)
+        self._validation_cache.pop(market_hash_name, None)
+    
     def get_skin_by_name(self, market_hash_name: str) -> Optional[Dict]:
         """Get a specific skin by its market hash name"""
+        if market_hash_name in self._skin_cache:
+            return self._skin_cache[market_hash_name]
+        
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
@@ -196,11 +230,43 @@ class ComprehensiveDatabaseManager:
         cursor.execute(query, (market_hash_name,))
         result = cursor.fetchone()
         conn.close()
-        return dict(result) if result else None
+        skin = dict(result) if result else None
+        self._skin_cache[market_hash_name] = skin
+        return skin
+    
+    def get_skins_by_names(self, market_hash_names: List[str]) -> Dict[str, Dict]:
+        """Get several skins in one query, keyed by market hash name (missing names are omitted)"""
+        # Only query the names that aren't cached yet
+        misses = [name for name in dict.fromkeys(market_hash_names) if name not in self._skin_cache]
+        if misses:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            
+            placeholders = ','.join(['?' for _ in misses])
+            query = f"""
+                SELECT *
+                FROM comprehensive_skins 
+                WHERE market_hash_name IN ({placeholders})
+            """
+            
+            cursor.execute(query, misses)
+            found = {row['market_hash_name']: dict(row) for row in cursor.fetchall()}
+            conn.close()
+            for name in misses:
+                self._skin_cache[name] = found.get(name)
+        
+        return {name: self._skin_cache[name] for name in market_hash_names
+                if self._skin_cache[name] is not None}
     
-    def build_market_data_from_comprehensive(self, pricing_data: Dict[str, Decimal]) -> MarketData:
-        """Build MarketData object from comprehensive database + runtime pricing"""
-        all_skins = self.get_all_tradeable_skins()
+    def build_market_data_from_comprehensive(self, pricing_data: Dict[str, Decimal],
+                                             all_skins: Optional[List[Dict]] = None) -> MarketData:
+        """Build MarketData object from comprehensive database + runtime pricing
+        
+        all_skins can be passed in when get_all_tradeable_skins() was already run.
+        """
+        if all_skins is None:
+            all_skins = self.get_all_tradeable_skins()
         
         collections = {}
         
@@ -233,6 +299,11 @@ class ComprehensiveDatabaseManager:
             if skin.rarity not in collections[collection_name].skins_by_rarity:
                 collections[collection_name].skins_by_rarity[skin.rarity] = []
             collections[collection_name].skins_by_rarity[skin.rarity].append(skin)
+        
+        # Record per-rarity totals once so summaries don't recount every list
+        for collection in collections.values():
+            collection.skin_count_by_rarity = {rarity: len(skins) for rarity, skins in collection.skins_by_rarity.items()}
+        
         return MarketData(
             collections=collections,
             last_updated=0  # Will be set when pricing is fetched
@@ -301,6 +372,7 @@ class ComprehensiveDatabaseManager:
         
         conn.commit()
         conn.close()
+        self._forget(market_hash_name)
         logger.debug(f"Marked {market_hash_name} as {status} with {discrepancy_percent:.1f}% discrepancy")
     
     def mark_price_valid(self, market_hash_name: str):
@@ -318,6 +390,7 @@ class ComprehensiveDatabaseManager:
         
         conn.commit()
         conn.close()
+        self._forget(market_hash_name)
         logger.debug(f"Marked {market_hash_name} as having valid pricing")
     
     def mark_price_validation_status(self, market_hash_name: str, status: str, steam_price: float = None, 
@@ -339,10 +412,14 @@ class ComprehensiveDatabaseManager:
         conn.commit()
         conn.close()
         
+        self._forget(market_hash_name)
         logger.debug(f"Marked {market_hash_name} as {status}")
     
     def get_price_validation_status(self, market_hash_name: str) -> Optional[Dict]:
         """Get price validation status for a skin"""
+        if market_hash_name in self._validation_cache:
+            return self._validation_cache[market_hash_name]
+        
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
@@ -357,14 +434,49 @@ class ComprehensiveDatabaseManager:
         result = cursor.fetchone()
         conn.close()
         
+        status = None
         if result:
-            return {
+            status = {
                 'status': result['price_validation_status'] or 'unvalidated',
                 'steam_price': result['steam_price'],
                 'discrepancy_percent': result['price_discrepancy_percent'],
                 'last_check': result['last_steam_check']
             }
-        return None
+        self._validation_cache[market_hash_name] = status
+        return status
+    
+    def get_price_validation_statuses(self, market_hash_names: List[str]) -> Dict[str, Dict]:
+        """Get price validation status for several skins in one query (missing names are omitted)"""
+        # Only query the names that aren't cached yet
+        misses = [name for name in dict.fromkeys(market_hash_names) if name not in self._validation_cache]
+        if misses:
+            conn = sqlite3.connect(self.db_path)
+            conn.row_factory = sqlite3.Row
+            cursor = conn.cursor()
+            
+            placeholders = ','.join(['?' for _ in misses])
+            query = f"""
+                SELECT market_hash_name, price_validation_status, steam_price, price_discrepancy_percent, last_steam_check
+                FROM comprehensive_skins 
+                WHERE market_hash_name IN ({placeholders})
+            """
+            
+            cursor.execute(query, misses)
+            found = {
+                row['market_hash_name']: {
+                    'status': row['price_validation_status'] or 'unvalidated',
+                    'steam_price': row['steam_price'],
+                    'discrepancy_percent': row['price_discrepancy_percent'],
+                    'last_check': row['last_steam_check']
+                }
+                for row in cursor.fetchall()
+            }
+            conn.close()
+            for name in misses:
+                self._validation_cache[name] = found.get(name)
+        
+        return {name: self._validation_cache[name] for name in market_hash_names
+                if self._validation_cache[name] is not None}
     
     def get_skins_needing_validation(self, limit: int = 100) -> List[Dict]:
         """Get skins that need price validation (unvalidated or old validations)"""
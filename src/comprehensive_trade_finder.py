@@ -5,8 +5,10 @@ Uses comprehensive database for skin metadata + runtime pricing for calculations
 
 import asyncio
 import logging
+from bisect import bisect_right
 import aiohttp
-from typing import List, Optional, Dict, Tuple
+import numpy as np
+from typing import AsyncIterator, List, Optional, Dict, Tuple
 from decimal import Decimal
 from collections import defaultdict, Counter
 
@@ -16,6 +18,7 @@ try:
     from .calculator import TradeUpCalculator, TradeUpCandidate
     from .models import MarketData, TradeUpResult, Skin, TradeUpInput, OutputSkin
     from .csfloat_listings import CSFloatListingsClient
+    from .float_scaling_numba import scale_float, make_scaler, score_combos, CONDITIONS, WEAR_BOUNDS
     # from .cache_manager import CacheManager  # Temporarily disabled
 except ImportError:
     # Fallback for direct execution
@@ -24,10 +27,15 @@ except ImportError:
     from calculator import TradeUpCalculator, TradeUpCandidate
     from models import MarketData, TradeUpResult, Skin, TradeUpInput, OutputSkin
     from csfloat_listings import CSFloatListingsClient
+    from float_scaling_numba import scale_float, make_scaler, score_combos, CONDITIONS, WEAR_BOUNDS
     # from cache_manager import CacheManager  # Temporarily disabled
 
 logger = logging.getLogger(__name__)
 
+# Array form of WEAR_BOUNDS for vectorized bucketing
+_WEAR_BOUNDARIES = np.array(WEAR_BOUNDS)
+_CONDITION_NAMES = np.array(CONDITIONS)
+
 class ComprehensiveTradeUpFinder:
     """Trade-up finder using comprehensive database + runtime pricing"""
     
@@ -57,29 +65,38 @@ class ComprehensiveTradeUpFinder:
         """
         logger.info("Initializing Comprehensive Trade-up Finder...")
         
-        if use_all_prices:
-            # Load all available prices
-            logger.info("Loading ALL available pricing data...")
-            all_prices = await self.pricing_client.get_all_prices()
-            self._cached_prices.update(all_prices)
-            logger.info(f"Loaded {len(all_prices)} prices from complete dataset")
-        else:
-            # Use sample size (default behavior for backward compatibility)
-            if sample_size is None:
-                sample_size = 1000
-            logger.info(f"Fetching sample prices (limit: {sample_size})...")
-            sample_prices = await self.pricing_client.get_sample_prices(limit=sample_size)
-            self._cached_prices.update(sample_prices)
-            logger.info(f"Loaded {len(sample_prices)} sample prices")
+        # Price fetching and the skin table scan are independent, so overlap them
+        prices, all_skins = await asyncio.gather(
+            self._load_prices(sample_size, use_all_prices),
+            asyncio.to_thread(self.db_manager.get_all_tradeable_skins)
+        )
+        self._cached_prices.update(prices)
         
         # Build market data using comprehensive database + pricing data
-        self.market_data = self.db_manager.build_market_data_from_comprehensive(self._cached_prices)
+        self.market_data = self.db_manager.build_market_data_from_comprehensive(self._cached_prices, all_skins)
         
         # Initialize calculator
         self.calculator = TradeUpCalculator(self.market_data)
         
         logger.info(f"Initialized with {len(self.market_data.collections)} collections and {len(self._cached_prices)} prices")
     
+    async def _load_prices(self, sample_size: Optional[int], use_all_prices: bool) -> Dict[str, Decimal]:
+        """Fetch either the complete price set or a sample of it"""
+        if use_all_prices:
+            # Load all available prices
+            logger.info("Loading ALL available pricing data...")
+            all_prices = await self.pricing_client.get_all_prices()
+            logger.info(f"Loaded {len(all_prices)} prices from complete dataset")
+            return all_prices
+        
+        # Use sample size (default behavior for backward compatibility)
+        if sample_size is None:
+            sample_size = 1000
+        logger.info(f"Fetching sample prices (limit: {sample_size})...")
+        sample_prices = await self.pricing_client.get_sample_prices(limit=sample_size)
+        logger.info(f"Loaded {len(sample_prices)} sample prices")
+        return sample_prices
+    
     async def find_profitable_trades(self,
                                    min_profit: float = 1.0,
                                    max_input_price: Optional[float] = None,
@@ -91,12 +108,28 @@ class ComprehensiveTradeUpFinder:
         logger.info(f"Searching for profitable trades (min_profit: ${min_profit}, offset: {offset})...")
 
         opportunities = []
+        skipped = 0  # Track how many trade-ups have been skipped
+
+        async for result in self.iter_profitable_trades(min_profit, max_input_price, target_collections):
+            if skipped < offset:
+                skipped += 1
+                continue
+            opportunities.append(result)
+            if len(opportunities) >= limit:
+                break
 
+        opportunities.sort(key=lambda x: x.expected_profit, reverse=True)
+        return opportunities[:limit]
+
+    async def iter_profitable_trades(self,
+                                     min_profit: float = 1.0,
+                                     max_input_price: Optional[float] = None,
+                                     target_collections: Optional[List[str]] = None
+                                     ) -> AsyncIterator[TradeUpResult]:
+        """Yield profitable trade-ups as they are found, so callers can stop the search early"""
         # Get all trade-able rarities
         rarities_to_check = ['Consumer Grade', 'Industrial Grade', 'Mil-Spec Grade', 'Restricted', 'Classified']
 
-        skipped = 0  # Track how many trade-ups have been skipped
-
         for input_rarity in rarities_to_check:
             logger.info(f"Checking {input_rarity} trade-ups...")
 
@@ -115,21 +148,16 @@ class ComprehensiveTradeUpFinder:
 
                 # Single collection trade-ups
                 if len(primary_input_skins) >= 1:
+                    result = None
                     try:
                         result = await self._calculate_single_collection_tradeup(
                             primary_collection, input_rarity, primary_input_skins,
                             max_input_price, min_profit
                         )
-                        if result:
-                            if skipped < offset:
-                                skipped += 1
-                                continue
-                            opportunities.append(result)
-                            if len(opportunities) >= limit:
-                                opportunities.sort(key=lambda x: x.expected_profit, reverse=True)
-                                return opportunities[:limit]
                     except Exception as e:
                         logger.debug(f"Error in single collection trade-up: {e}")
+                    if result:
+                        yield result
 
                 # Mixed collection trade-ups
                 for secondary_collection in collections:
@@ -141,26 +169,18 @@ class ComprehensiveTradeUpFinder:
                         continue
 
                     for split in [(9, 1), (8, 2), (7, 3), (6, 4), (5, 5)]:
+                        result = None
                         try:
                             result = await self._calculate_mixed_collection_tradeup(
                                 primary_collection, secondary_collection, input_rarity,
                                 primary_input_skins, secondary_input_skins, split,
                                 max_input_price, min_profit
                             )
-                            if result:
-                                if skipped < offset:
-                                    skipped += 1
-                                    continue
-                                opportunities.append(result)
-                                if len(opportunities) >= limit:
-                                    opportunities.sort(key=lambda x: x.expected_profit, reverse=True)
-                                    return opportunities[:limit]
                         except Exception as e:
                             logger.debug(f"Error in mixed collection trade-up: {e}")
+                        if result:
+                            yield result
 
-        opportunities.sort(key=lambda x: x.expected_profit, reverse=True)
-        return opportunities[:limit]
-    
     async def _calculate_single_collection_tradeup(self,
                                                   collection: str,
                                                   input_rarity: str,
@@ -217,9 +237,14 @@ class ComprehensiveTradeUpFinder:
                 validated_prices = await self._validate_prices(new_prices, marketable_inputs + marketable_outputs)
                 self._cached_prices.update(validated_prices)
         
-        # Find best input skin for different wear conditions
-        best_result = None
-        best_profit = min_profit
+        # Output float ranges don't change between wear conditions, so bind them once
+        output_scalers = [
+            (output_skin, make_scaler(output_skin.get('min_float', 0.0), output_skin.get('max_float', 1.0)))
+            for output_skin in marketable_outputs
+        ]
+        
+        # Collect the best-priced candidate for each wear condition
+        candidates = []
         for condition in ['Factory New', 'Minimal Wear', 'Field-Tested', 'Well-Worn', 'Battle-Scarred']:
             condition_inputs = [s for s in marketable_inputs if s.get('condition_name') == condition]
             if not condition_inputs:
@@ -254,18 +279,19 @@ class ComprehensiveTradeUpFinder:
             if not cheapest_input:
                 continue
             
-            total_input_cost = cheapest_price * 10
-              # Calculate deterministic output float
+            # Calculate deterministic output float
             input_float = self._get_condition_float(cheapest_input)
+            input_min = float(cheapest_input.get('min_float', 0.0))
+            input_max = float(cheapest_input.get('max_float', 1.0))
             
             # All outputs are now possible since we scale the float to each output's range
-            valid_outputs = marketable_outputs            # Calculate expected output value using proper trade-up probabilities
+            # Calculate expected output value using proper trade-up probabilities
             # For single collection: all outputs have equal probability (1/m_C)
             # Only include outputs with valid pricing data AND valid price validation status
             valid_priced_outputs = []
-            for output_skin in valid_outputs:
+            for output_skin, scale in output_scalers:
                 # Calculate the actual output float and condition after scaling
-                scaled_float, predicted_condition = self._calculate_output_float_and_condition(input_float, output_skin, cheapest_input)
+                scaled_float, predicted_condition = scale(input_float, input_min, input_max)
                 
                 # Look for condition-specific pricing first
                 condition_market_name = f"{output_skin['market_hash_name']} ({predicted_condition})"
@@ -295,66 +321,81 @@ class ComprehensiveTradeUpFinder:
                             valid_priced_outputs.append((output_skin, float(output_price), scaled_float, predicted_condition))
             if not valid_priced_outputs:
                 continue  # Skip if no valid pricing data
-            
-            num_outputs = len(valid_priced_outputs)
-            expected_output_value = 0
-            
-            output_skin_objects = []            
-            for output_skin, output_price, scaled_float, predicted_condition in valid_priced_outputs:
-                # Equal probability for each output in single collection
-                probability = 1.0 / num_outputs
-                expected_output_value += output_price * probability                
-                skin_obj = Skin(
-                    name=f"{output_skin['market_hash_name']} ({predicted_condition})",
-                    rarity=output_skin['rarity'],
-                    price=Decimal(str(output_price)),
-                    collection=collection,
-                    float_min=output_skin.get('min_float', 0.0),
-                    float_max=output_skin.get('max_float', 1.0)
-                )
-                output_obj = OutputSkin(skin=skin_obj, probability=probability)
-                # Store predicted condition for display
-                output_obj.predicted_condition = predicted_condition
-                output_obj.predicted_float = scaled_float
-                output_skin_objects.append(output_obj)
-            
-            # Apply Steam market fee (15%)
-            expected_output_value *= 0.85
-            expected_profit = expected_output_value - total_input_cost
-            
-            if expected_profit > best_profit:
-                best_profit = expected_profit
-                
-                # Create input configuration
-                input_skin = Skin(
-                    name=cheapest_input['market_hash_name'],
-                    rarity=cheapest_input['rarity'],
-                    price=Decimal(str(cheapest_price)),
-                    collection=collection,
-                    float_min=cheapest_input.get('min_float', 0.0),
-                    float_max=cheapest_input.get('max_float', 1.0)
-                )
-                
-                trade_input = TradeUpInput(
-                    collection1=collection,
-                    collection2=None,
-                    split_ratio=(10, 0),
-                    skins=[input_skin] * 10,
-                    total_cost=Decimal(str(total_input_cost)),
-                    average_float=input_float
-                )
-                
-                best_result = TradeUpResult(
-                    input_config=trade_input,
-                    output_skins=output_skin_objects,
-                    expected_output_price=Decimal(str(expected_output_value)),
-                    raw_profit=Decimal(str(expected_profit)),
-                    roi_percentage=float(expected_profit / total_input_cost * 100),
-                    guaranteed_profit=False,
-                    min_output_price=min(Decimal(str(price)) for _, price, _, _ in valid_priced_outputs)
-                )
+            candidates.append((cheapest_input, cheapest_price, input_float, valid_priced_outputs))
         
-        return best_result
+        if not candidates:
+            return None
+        
+        # Score every candidate in one kernel call: equal probability (1/m_C) per output
+        # in a single collection, padded with zero probability up to the widest row
+        width = max(len(outputs) for _, _, _, outputs in candidates)
+        input_costs = np.empty(len(candidates))
+        probs = np.zeros((len(candidates), width))
+        out_prices = np.zeros((len(candidates), width))
+        for i, (_, price, _, outputs) in enumerate(candidates):
+            input_costs[i] = price * 10
+            probs[i, :len(outputs)] = 1.0 / len(outputs)
+            out_prices[i, :len(outputs)] = [output_price for _, output_price, _, _ in outputs]
+        
+        # Steam market fee (15%) is applied inside the kernel
+        profits = score_combos(input_costs, probs, out_prices, 0.85)
+        best = int(np.argmax(profits))  # first maximum, matching the old condition order
+        expected_profit = float(profits[best])
+        if expected_profit <= min_profit:
+            return None
+        
+        cheapest_input, cheapest_price, input_float, valid_priced_outputs = candidates[best]
+        total_input_cost = float(input_costs[best])
+        expected_output_value = expected_profit + total_input_cost
+        probability = 1.0 / len(valid_priced_outputs)
+        
+        output_skin_objects = []
+        for output_skin, output_price, scaled_float, predicted_condition in valid_priced_outputs:
+            skin_obj = Skin(
+                name=f"{output_skin['market_hash_name']} ({predicted_condition})",
+                rarity=output_skin['rarity'],
+                price=Decimal(str(output_price)),
+                collection=collection,
+                float_min=output_skin.get('min_float', 0.0),
+                float_max=output_skin.get('max_float', 1.0)
+            )
+            output_obj = OutputSkin(skin=skin_obj, probability=probability)
+            # Store predicted condition for display
+            output_obj.predicted_condition = predicted_condition
+            output_obj.predicted_float = scaled_float
+            output_skin_objects.append(output_obj)
+        
+        # Create input configuration
+        input_skin = Skin(
+            name=cheapest_input['market_hash_name'],
+            rarity=cheapest_input['rarity'],
+            price=Decimal(str(cheapest_price)),
+            collection=collection,
+            float_min=cheapest_input.get('min_float', 0.0),
+            float_max=cheapest_input.get('max_float', 1.0)
+        )
+        
+        trade_input = TradeUpInput(
+            collection1=collection,
+            collection2=None,
+            split_ratio=(10, 0),
+            skins=[input_skin] * 10,
+            total_cost=Decimal(str(total_input_cost)),
+            average_float=input_float
+        )
+        
+        # Guaranteed when even the cheapest outcome beats the input cost after the 15% Steam fee
+        min_output_price = min(Decimal(str(price)) for _, price, _, _ in valid_priced_outputs)
+        
+        return TradeUpResult(
+            input_config=trade_input,
+            output_skins=output_skin_objects,
+            expected_output_price=Decimal(str(expected_output_value)),
+            raw_profit=Decimal(str(expected_profit)),
+            roi_percentage=float(expected_profit / total_input_cost * 100),
+            guaranteed_profit=min_output_price * Decimal('0.85') > trade_input.total_cost,
+            min_output_price=min_output_price
+        )
         """Calculate a specific trade-up opportunity"""
         
         # Get item names for pricing
@@ -1147,10 +1188,6 @@ class ComprehensiveTradeUpFinder:
         output_min = float(output_skin.get('min_float', 0.0))
         output_max = float(output_skin.get('max_float', 1.0))
 
-        print(output_min)
-        print(output_max)
-
-
         # Use the input skin's actual float range for proper CS:GO/CS2 trade-up scaling
         if input_skin:
             input_min = float(input_skin.get('min_float', 0.0))
@@ -1160,47 +1197,59 @@ class ComprehensiveTradeUpFinder:
             input_min = 0.06
             input_max = 0.8
         
-        # Calculate relative position within the input skin's float range
-        if input_max > input_min:
-            relative_position = (input_float - input_min) / (input_max - input_min)
+        # Scaling and condition bucketing run in the compiled kernel
+        scaled_output_float, condition_index = scale_float(float(input_float), input_min, input_max, output_min, output_max)
+        return scaled_output_float, CONDITIONS[condition_index]
+
+    def _calculate_output_float_and_condition_batch(self, input_floats: np.ndarray, output_skin: Dict,
+                                                    input_skin: Dict = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Array version of _calculate_output_float_and_condition for one output skin
+        
+        Returns (scaled_floats, condition_names), both shaped like input_floats.
+        """
+        output_min = float(output_skin.get('min_float', 0.0))
+        output_max = float(output_skin.get('max_float', 1.0))
+        
+        if input_skin:
+            input_min = float(input_skin.get('min_float', 0.0))
+            input_max = float(input_skin.get('max_float', 1.0))
         else:
-            relative_position = 0.0
-        
-        # Clamp relative position to 0-1 range
-        relative_position = max(0.0, min(1.0, relative_position))
-        
-        # Scale to output skin's range using the relative position
-        scaled_output_float = output_min + (relative_position * (output_max - output_min))
-        
-        # Clamp to skin's range (safety check)
-        scaled_output_float = max(output_min, min(output_max, scaled_output_float))
-        
-        # Determine condition from scaled float
-        if scaled_output_float < 0.07:
-            condition = "Factory New"
-        elif scaled_output_float < 0.15:
-            condition = "Minimal Wear"
-        elif scaled_output_float < 0.38:
-            condition = "Field-Tested"
-        elif scaled_output_float < 0.45:
-            condition = "Well-Worn"
+            input_min = 0.06
+            input_max = 0.8
+        
+        scaled, condition_indices = self.scale_floats_batch(
+            input_floats, np.array([output_min]), np.array([output_max]), input_min, input_max
+        )
+        return scaled[:, 0], _CONDITION_NAMES[condition_indices[:, 0]]
+
+    def scale_floats_batch(self, input_floats: np.ndarray, mins: np.ndarray, maxs: np.ndarray,
+                           input_min: float = 0.06, input_max: float = 0.8) -> Tuple[np.ndarray, np.ndarray]:
+        """Vectorized _calculate_output_float_and_condition over many inputs and output skins
+        
+        Broadcasts input_floats (shape I) against output ranges mins/maxs (shape S).
+        Returns (scaled_floats, condition_indices), both shaped (I, S); indices point into CONDITIONS.
+        """
+        input_floats = np.asarray(input_floats, dtype=np.float64)
+        mins = np.asarray(mins, dtype=np.float64)
+        maxs = np.asarray(maxs, dtype=np.float64)
+        
+        # Relative position within the input float range, clamped to 0-1
+        if input_max > input_min:
+            relative_positions = np.clip((input_floats - input_min) / (input_max - input_min), 0.0, 1.0)
         else:
-            condition = "Battle-Scarred"
-            
-        return scaled_output_float, condition
+            relative_positions = np.zeros_like(input_floats)
+        
+        # Scale every input onto every output skin's range and clamp (safety check)
+        scaled = mins[None, :] + relative_positions[:, None] * (maxs - mins)[None, :]
+        scaled = np.clip(scaled, mins[None, :], maxs[None, :])
+        
+        # side='right' matches the scalar "< boundary" comparisons
+        condition_indices = np.searchsorted(_WEAR_BOUNDARIES, scaled, side='right')
+        return scaled, condition_indices
 
     def _get_wear_from_float(self, float_value: float) -> str:
         """Get wear condition name from float value"""
-        if float_value < 0.07:
-            return "Factory New"
-        elif float_value < 0.15:
-            return "Minimal Wear"
-        elif float_value < 0.38:
-            return "Field-Tested"
-        elif float_value < 0.45:
-            return "Well-Worn"
-        else:
-            return "Battle-Scarred"
+        return CONDITIONS[bisect_right(WEAR_BOUNDS, float_value)]
     
     async def _calculate_mixed_collection_tradeup(self,
                                                  primary_collection: str,
@@ -1355,14 +1404,17 @@ class ComprehensiveTradeUpFinder:
             average_float=average_float
         )
         
+        # Guaranteed when even the cheapest outcome beats the input cost after the 15% Steam fee
+        min_output_price = min(Decimal(str(skin.skin.price)) for skin in output_skin_objects)
+        
         return TradeUpResult(
             input_config=trade_input,
             output_skins=output_skin_objects,
             expected_output_price=Decimal(str(expected_output_value)),
             raw_profit=Decimal(str(expected_profit)),
             roi_percentage=float(expected_profit / total_input_cost * 100),
-            guaranteed_profit=False,
-            min_output_price=min(Decimal(str(skin.skin.price)) for skin in output_skin_objects)
+            guaranteed_profit=min_output_price * Decimal('0.85') > trade_input.total_cost,
+            min_output_price=min_output_price
         )
 
     def _find_cheapest_input(self, input_skins: List[Dict], max_input_price: Optional[float]) -> Optional[Dict]:
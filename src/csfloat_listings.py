@@ -4,15 +4,18 @@ CSFloat Listings Client for real-time float and pricing data
 import asyncio
 import aiohttp
 import logging
+from bisect import bisect_right
 from typing import List, Dict, Optional, Tuple
 from decimal import Decimal
 
 try:
     from .config import config
     from .api_client import RateLimiter
+    from .float_scaling_numba import CONDITIONS, WEAR_BOUNDS
 except ImportError:
     from config import config
     from api_client import RateLimiter
+    from float_scaling_numba import CONDITIONS, WEAR_BOUNDS
 
 logger = logging.getLogger(__name__)
 
@@ -125,16 +128,7 @@ class CSFloatListingsClient:
     
     def _get_wear_from_float(self, float_value: float) -> str:
         """Convert float value to wear condition"""
-        if float_value < 0.07:
-            return 'Factory New'
-        elif float_value < 0.15:
-            return 'Minimal Wear'
-        elif float_value < 0.38:
-            return 'Field-Tested'
-        elif float_value < 0.45:
-            return 'Well-Worn'
-        else:
-            return 'Battle-Scarred'
+        return CONDITIONS[bisect_right(WEAR_BOUNDS, float_value)]
     
     def scale_float_to_skin_range(self, input_float: float, 
                                  skin_min_float: float, 
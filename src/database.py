@@ -185,10 +185,11 @@ class DatabaseManager:
             
             collection.skins_by_rarity[skin.rarity].append(skin)
         
-        # Sort skins within each rarity by price
+        # Sort skins within each rarity by price and record per-rarity totals
         for collection in collections.values():
             for rarity_skins in collection.skins_by_rarity.values():
                 rarity_skins.sort(key=lambda s: s.price)
+            collection.skin_count_by_rarity = {rarity: len(rarity_skins) for rarity, rarity_skins in collection.skins_by_rarity.items()}
         
         return MarketData(
             collections=collections,
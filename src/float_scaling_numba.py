@@ -0,0 +1,82 @@
+"""
+Numba-compiled kernels for CS2 trade-ups
+Maps an input float onto an output skin's float range and buckets the result
+into a wear condition, and scores candidate trade-ups by expected profit.
+Falls back to plain Python when numba is not installed.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; run the same code uncompiled
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# Wear conditions indexed by the kernel's condition index
+CONDITIONS = ("Factory New", "Minimal Wear", "Field-Tested", "Well-Worn", "Battle-Scarred")
+# Lower bounds of Minimal Wear, Field-Tested, Well-Worn and Battle-Scarred
+WEAR_BOUNDS = (0.07, 0.15, 0.38, 0.45)
+
+# Shared by the JIT below and the AOT build in build_float_scaling_aot.py
+SCALE_FLOAT_SIGNATURE = "Tuple((float64, int64))(float64, float64, float64, float64, float64)"
+
+def _scale_float(input_float, input_min, input_max, output_min, output_max):
+    """Scale input_float from the input range to the output range.
+    Returns (scaled_float, condition_index) where the index points into CONDITIONS.
+    """
+    # Relative position within the input skin's float range, clamped to 0-1
+    if input_max > input_min:
+        relative_position = (input_float - input_min) / (input_max - input_min)
+    else:
+        relative_position = 0.0
+    relative_position = max(0.0, min(1.0, relative_position))
+
+    # Scale to the output skin's range and clamp (safety check)
+    scaled = output_min + relative_position * (output_max - output_min)
+    scaled = max(output_min, min(output_max, scaled))
+
+    # Count the boundaries at or below the float: branchless, and compiles to
+    # four compares and adds instead of a chain of unpredictable branches
+    condition_index = ((scaled >= WEAR_BOUNDS[0]) + (scaled >= WEAR_BOUNDS[1])
+                       + (scaled >= WEAR_BOUNDS[2]) + (scaled >= WEAR_BOUNDS[3]))
+    return scaled, condition_index
+
+# Prefer the ahead-of-time compiled extension so importing pays no JIT cost
+try:
+    try:
+        from ._float_scaling_aot import scale_float
+    except ImportError:
+        from _float_scaling_aot import scale_float
+except ImportError:  # not built; compile (or load from numba's cache) on import
+    scale_float = njit(SCALE_FLOAT_SIGNATURE, cache=True, fastmath=True)(_scale_float)
+
+def make_scaler(output_min, output_max):
+    """Bind an output skin's float range once for repeated scaling.
+    Returns scale(input_float, input_min=0.06, input_max=0.8) -> (scaled_float, condition_name).
+    """
+    output_min = float(output_min)
+    output_max = float(output_max)
+
+    def scale(input_float, input_min=0.06, input_max=0.8):
+        scaled, condition_index = scale_float(float(input_float), input_min, input_max, output_min, output_max)
+        return scaled, CONDITIONS[condition_index]
+    return scale
+
+# Only a handful of rows per call, so no parallel dispatch; compiled lazily on first use
+@njit(cache=True)
+def score_combos(input_costs, probs, out_prices, fee_multiplier):
+    """Expected profit of each candidate trade-up (one per row).
+    Row i pays input_costs[i] and yields out_prices[i, j] with probability probs[i, j];
+    unused output slots are padded with zero probability.
+    """
+    n_combos, n_outputs = out_prices.shape
+    profits = np.empty(n_combos)
+    for i in range(n_combos):
+        expected = 0.0
+        for j in range(n_outputs):
+            expected += probs[i, j] * out_prices[i, j]
+        profits[i] = expected * fee_multiplier - input_costs[i]
+    return profits
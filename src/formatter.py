@@ -4,10 +4,12 @@ Provides human-readable output of trade-up opportunities.
 """
 
 import logging
+from bisect import bisect_right
 from typing import List
 from decimal import Decimal
 
 from .models import TradeUpResult, OutputSkin, Skin
+from .float_scaling_numba import CONDITIONS, WEAR_BOUNDS
 
 logger = logging.getLogger(__name__)
 
@@ -66,16 +68,7 @@ class TradeUpFormatter:
         
         # Determine condition from float
         avg_float = result.input_config.average_float
-        if avg_float < 0.07:
-            condition = "Factory New"
-        elif avg_float < 0.15:
-            condition = "Minimal Wear"
-        elif avg_float < 0.38:
-            condition = "Field-Tested"
-        elif avg_float < 0.45:
-            condition = "Well-Worn"
-        else:
-            condition = "Battle-Scarred"
+        condition = CONDITIONS[bisect_right(WEAR_BOUNDS, avg_float)]
             
         lines.append(f"   Input Condition: {condition}")
         lines.append("   ⚡ Output float scaling: Each skin will have different predicted conditions!")
@@ -2,10 +2,21 @@
 Data models for CS2 Trade-up Calculator
 """
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, field
 from typing import List, Dict, Optional, Tuple
 from decimal import Decimal
 
+_NAME_PREFIX_RE = re.compile(r'^(★\s*)?(StatTrak™\s*|Souvenir\s*)?')
+_WEAR_SUFFIX_RE = re.compile(r'\s*\([^)]*\)\s*$')
+
+def _weapon_skin_key(market_hash_name: str) -> Optional[Tuple[str, str]]:
+    """Normalize "StatTrak™ AK-47 | Redline (Field-Tested)" to ("AK-47", "Redline")"""
+    if ' | ' not in market_hash_name:
+        return None
+    weapon, skin_name = market_hash_name.split(' | ', 1)
+    return _NAME_PREFIX_RE.sub('', weapon).strip(), _WEAR_SUFFIX_RE.sub('', skin_name).strip()
+
 @dataclass
 class Skin:
     """Represents a CS2 skin with all necessary information"""
@@ -17,6 +28,10 @@ class Skin:
     float_max: float
     marketable: bool = True
     stattrak: bool = False
+    price_f: float = field(init=False, repr=False, compare=False)  # float(price), converted once
+    
+    def __post_init__(self):
+        self.price_f = float(self.price)
     
     @property
     def float_mid(self) -> float:
@@ -70,9 +85,9 @@ class TradeUpResult:
     
     @property
     def profit_margin(self) -> Decimal:
-        """Absolute profit margin for guaranteed profits"""
+        """Absolute profit margin for guaranteed profits, after the 15% Steam fee"""
         if self.guaranteed_profit:
-            return self.min_output_price - self.input_config.total_cost
+            return self.min_output_price * Decimal('0.85') - self.input_config.total_cost
         return Decimal('0')
 
 @dataclass
@@ -80,6 +95,7 @@ class CollectionInfo:
     """Information about a skin collection and its rarities"""
     name: str
     skins_by_rarity: Dict[str, List[Skin]]
+    skin_count_by_rarity: Dict[str, int] = field(default_factory=dict)  # Filled once when market data is built
     
     def get_skins(self, rarity: str) -> List[Skin]:
         """Get all skins of a specific rarity in this collection"""
@@ -94,6 +110,20 @@ class MarketData:
     """Container for all market data organized by collection and rarity"""
     collections: Dict[str, CollectionInfo]
     last_updated: float  # timestamp
+    _by_weapon_skin: Dict[Tuple[str, str], Skin] = field(default_factory=dict, init=False, repr=False)
+    
+    def __post_init__(self):
+        """Index skins by (weapon, skin name) once so lookups are a single hash probe"""
+        for collection in self.collections.values():
+            for rarity_skins in collection.skins_by_rarity.values():
+                for skin in rarity_skins:
+                    key = _weapon_skin_key(skin.name)
+                    if key:
+                        self._by_weapon_skin.setdefault(key, skin)
+    
+    def get_skin_by_weapon(self, weapon: str, skin_name: str) -> Optional[Skin]:
+        """Get the first indexed skin for a weapon and skin name, e.g. ("AK-47", "Redline")"""
+        return self._by_weapon_skin.get((weapon, skin_name))
     
     def get_collection(self, name: str) -> Optional[CollectionInfo]:
         """Get collection by name"""
@@ -5,7 +5,9 @@ Fetches current market prices for specific skins when needed
 
 import asyncio
 import aiohttp
+import json
 import logging
+import os
 import statistics
 import time
 import numpy as np
@@ -13,18 +15,25 @@ import requests
 from typing import Dict, List, Optional, Tuple
 from decimal import Decimal
 from datetime import datetime, timedelta
+from pathlib import Path
 
 try:
     from .config import config
 except ImportError:
     from config import config
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    _json_loads = json.loads
+
 logger = logging.getLogger(__name__)
 
 class RuntimePricingClient:
     """Client for fetching current market prices at runtime"""
     
-    def __init__(self):        
+    def __init__(self, cache_path: Optional[str] = None):        
         self.base_url = config.api.PRICE_EMPIRE_BASE_URL
         self.headers = config.price_empire_headers
         
@@ -33,6 +42,10 @@ class RuntimePricingClient:
         self._cache_timestamp: Optional[datetime] = None
         self._cache_duration = timedelta(minutes=30)  # Cache for 30 minutes
         
+        # Optional on-disk snapshot so repeated runs skip the API entirely
+        self.cache_path = cache_path or os.getenv('CSTA_PRICE_CACHE')
+        self._disk_cache_duration = timedelta(hours=24)
+        
     async def _ensure_price_cache_loaded(self) -> None:
         """Ensure the price cache is loaded and current"""
         now = datetime.now()
@@ -42,9 +55,18 @@ class RuntimePricingClient:
             now - self._cache_timestamp > self._cache_duration or
             not self._price_cache):
             
+            # Snapshot file IO runs on a worker thread so it doesn't stall the event loop
+            # (initialize overlaps this with the skin table scan)
+            if not self._price_cache and await asyncio.to_thread(self._load_fresh_disk_cache):
+                self._cache_timestamp = now
+                return
+            
             logger.info("Loading/refreshing price cache...")
             await self._load_all_prices()
             self._cache_timestamp = now
+            
+            if self.cache_path and self._price_cache:
+                await asyncio.to_thread(self.save_cache, self.cache_path)
         else:
             logger.debug(f"Using cached prices (loaded {(now - self._cache_timestamp).total_seconds():.0f}s ago)")
     
@@ -66,13 +88,19 @@ class RuntimePricingClient:
                         logger.error(f"Price cache load failed: {response.status}")
                         return
                     
-                    data = await response.json()
+                    # Read the stream directly: response.read() would keep a copy
+                    # of the raw body on the response until the block exits
+                    data = _json_loads(await response.content.read())
                     logger.info(f"Received price data for {len(data)} items")
                     
                     # Cache all prices
                     self._price_cache.clear()
                     
-                    for item in data:
+                    # Pop items off the parsed list so it shrinks while the cache
+                    # grows, instead of both being fully resident at once
+                    data.reverse()
+                    while data:
+                        item = data.pop()
                         market_hash_name = item.get('market_hash_name', '')
                         if market_hash_name:
                             price = self._extract_best_price(item)
@@ -84,6 +112,50 @@ class RuntimePricingClient:
             except Exception as e:
                 logger.error(f"Error loading price cache: {e}")
         
+    def save_cache(self, path: str) -> None:
+        """Save the price cache as NumPy name/price arrays"""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        names = np.array(list(self._price_cache.keys()), dtype=str)
+        prices = np.array([float(price) for price in self._price_cache.values()], dtype=np.float64)
+        
+        # Write through a file object so np.savez keeps the exact file name
+        with open(path, 'wb') as f:
+            np.savez(f, names=names, prices=prices)
+        logger.info(f"Saved {len(names)} prices to {path}")
+    
+    def load_cache(self, path: str) -> None:
+        """Replace the price cache with prices saved by save_cache()"""
+        with np.load(path) as data:
+            names = data['names'].tolist()
+            prices = data['prices'].tolist()
+        
+        self._price_cache = {name: Decimal(str(price)) for name, price in zip(names, prices)}
+        logger.info(f"Loaded {len(self._price_cache)} prices from {path}")
+    
+    def _load_fresh_disk_cache(self) -> bool:
+        """Load the on-disk snapshot if configured and younger than 24h"""
+        if not self.cache_path:
+            return False
+        
+        path = Path(self.cache_path)
+        if not path.exists():
+            return False
+        
+        age = datetime.now() - datetime.fromtimestamp(path.stat().st_mtime)
+        if age > self._disk_cache_duration:
+            logger.info(f"Price cache {path} is {age} old, refreshing from API")
+            return False
+        
+        try:
+            self.load_cache(path)
+        except Exception as e:
+            logger.warning(f"Could not load price cache {path}: {e}")
+            return False
+        
+        return bool(self._price_cache)
+    
     async def fetch_prices_for_items(self, item_names: List[str]) -> Dict[str, Decimal]:
         """Fetch current prices for a list of item names"""
         logger.info(f"Fetching prices for {len(item_names)} items from cache...")
@@ -425,6 +425,8 @@ WEAPON_NAME_VARIATIONS = {
 class SkinMapper:
     """Maps CS2 skins to their collections and rarities"""
     
+    __slots__ = ("collection_map", "skin_map", "weapon_variations")
+    
     def __init__(self):
         self.collection_map = COLLECTION_MAPPING
         self.skin_map = SKIN_COLLECTION_RARITY_MAP
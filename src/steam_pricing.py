@@ -8,27 +8,96 @@ import aiohttp
 import logging
 import time
 import json
-from typing import Dict, List, Optional, Tuple
+import re
+from typing import Dict, Iterator, List, Mapping, Optional, Tuple
 from decimal import Decimal
 import urllib.parse
+import sqlite3
+import types
+from itertools import islice
+from pathlib import Path
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    _json_loads = json.loads
 
 logger = logging.getLogger(__name__)
 
+# Strips StatTrak/Souvenir/star prefixes and the wear suffix so every variant
+# of a skin maps to the same search/render query
+_SEARCH_PREFIX_RE = re.compile(r'^(★\s*)?(StatTrak™\s*|Souvenir\s*)?')
+_WEAR_SUFFIX_RE = re.compile(r'\s*\([^)]*\)\s*$')
+
+# Extracts the amount from Steam price strings such as "$1,234.56" or "$1.23 USD"
+_PRICE_RE = re.compile(r'([\d,]+\.\d{2})')
+
+class TokenBucketLimiter:
+    """Token-bucket rate limiter shared by concurrent requests"""
+    
+    def __init__(self, max_rate: float, time_period: float = 1.0):
+        self.max_rate = max_rate
+        self.time_period = time_period
+        self._fill_rate = max_rate / time_period
+        self._tokens = float(max_rate)
+        self._last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available, then consume it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.max_rate, self._tokens + (now - self._last_refill) * self._fill_rate)
+                self._last_refill = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) / self._fill_rate)
+    
+    async def __aenter__(self):
+        await self.acquire()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
 class SteamMarketPricingClient:
     """Fetches pricing data from Steam Market API"""
     
-    def __init__(self):
+    def __init__(self, cache_path: str = "data/steam_price_cache.db", cache_ttl: int = 6 * 3600):
         self.base_url = "https://steamcommunity.com/market/priceoverview/"
+        self.search_url = "https://steamcommunity.com/market/search/render/"
+        self.search_page_size = 100
         self.app_id = "730"  # CS2 App ID
         self.currency = "1"  # USD
         self.country = "US"
         self.rate_limit_delay = 1.1  # Steam has rate limits
+        self.max_concurrent = 20  # Connection pool size; bounds in-flight requests
         self._cache = {}
         self._session = None
+        self._limiter = None
+        self.cache_path = cache_path
+        self.cache_ttl = cache_ttl  # Seconds before a persisted price is refetched
+        self.cache_commit_interval = 50
+        self._disk_cache = None
+        self._pending_writes = 0
     
     async def __aenter__(self):
         """Async context manager entry"""
+        # Global QPS ceiling shared by all in-flight requests
+        self._limiter = TokenBucketLimiter(int(1 / self.rate_limit_delay * 60), 60)
+        self._open_disk_cache()
         self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=self.max_concurrent,
+                limit_per_host=self.max_concurrent,
+                ttl_dns_cache=600,
+                keepalive_timeout=60
+            ),
             timeout=aiohttp.ClientTimeout(total=30),
             headers={'User-Agent': 'CS2 Trade-up Calculator'}
         )
@@ -38,6 +107,65 @@ class SteamMarketPricingClient:
         """Async context manager exit"""
         if self._session:
             await self._session.close()
+            self._session = None
+        self._close_disk_cache()
+    
+    def _open_disk_cache(self):
+        """Open the persistent price cache so warm runs skip the network"""
+        if self._disk_cache is not None:
+            return
+        
+        Path(self.cache_path).parent.mkdir(parents=True, exist_ok=True)
+        self._disk_cache = sqlite3.connect(self.cache_path)
+        self._disk_cache.execute("""
+            CREATE TABLE IF NOT EXISTS price_cache (
+                name TEXT PRIMARY KEY,
+                price REAL,
+                ts INTEGER
+            )
+        """)
+        self._disk_cache.commit()
+    
+    def _close_disk_cache(self):
+        """Flush pending writes and close the persistent price cache"""
+        if self._disk_cache is None:
+            return
+        
+        self._disk_cache.commit()
+        self._disk_cache.close()
+        self._disk_cache = None
+        self._pending_writes = 0
+    
+    def _get_disk_cached(self, market_hash_name: str) -> Tuple[bool, Optional[float]]:
+        """Look up a non-expired persisted price. Returns (hit, price)"""
+        if self._disk_cache is None:
+            return False, None
+        
+        row = self._disk_cache.execute(
+            "SELECT price FROM price_cache WHERE name = ? AND ts > ?",
+            (market_hash_name, int(time.time()) - self.cache_ttl)
+        ).fetchone()
+        
+        if row is None:
+            return False, None
+        
+        # Negative lookups are stored as -1 so repeated misses skip the network too
+        price = row[0]
+        return True, (None if price < 0 else price)
+    
+    def _set_disk_cached(self, market_hash_name: str, price: Optional[float]):
+        """Persist a price (or a miss as -1), committing every N rows"""
+        if self._disk_cache is None:
+            return
+        
+        self._disk_cache.execute(
+            "INSERT OR REPLACE INTO price_cache (name, price, ts) VALUES (?, ?, ?)",
+            (market_hash_name, -1 if price is None else price, int(time.time()))
+        )
+        self._pending_writes += 1
+        if self._pending_writes >= self.cache_commit_interval:
+            self._disk_cache.commit()
+            self._pending_writes = 0
     
     async def get_price(self, market_hash_name: str) -> Optional[float]:
         """Get price for a single item from Steam Market"""
@@ -48,6 +176,12 @@ class SteamMarketPricingClient:
         if not self._session:
             raise RuntimeError("Must use async context manager (async with)")
         
+        hit, cached_price = self._get_disk_cached(market_hash_name)
+        if hit:
+            if cached_price is not None:
+                self._cache[market_hash_name] = cached_price
+            return cached_price
+        
         params = {
             'country': self.country,
             'currency': self.currency,
@@ -56,95 +190,184 @@ class SteamMarketPricingClient:
         }
         
         try:
-            await asyncio.sleep(self.rate_limit_delay)  # Rate limiting
-            
-            async with self._session.get(self.base_url, params=params) as response:
+            async with self._limiter, self._session.get(self.base_url, params=params) as response:
                 if response.status != 200:
                     logger.warning(f"Steam API returned {response.status} for {market_hash_name}")
+                    if response.status == 404:
+                        self._set_disk_cached(market_hash_name, None)
                     return None
                 
-                data = await response.json()
+                data = _json_loads(await response.read())
                 
                 if not data.get('success'):
                     logger.debug(f"Steam API success=False for {market_hash_name}")
+                    self._set_disk_cached(market_hash_name, None)
                     return None
                 
                 # Parse price from Steam format (e.g., "$1.23")
                 lowest_price = data.get('lowest_price')
                 if lowest_price:
-                    # Remove currency symbol and convert to float
-                    price_str = lowest_price.replace('$', '').replace(',', '')
-                    try:
-                        price = float(price_str)
-                        self._cache[market_hash_name] = price
-                        logger.debug(f"Got Steam price for {market_hash_name}: ${price:.2f}")
-                        return price
-                    except ValueError:
+                    # Extract the amount and convert via integer cents
+                    match = _PRICE_RE.search(lowest_price)
+                    if not match:
                         logger.warning(f"Could not parse price '{lowest_price}' for {market_hash_name}")
                         return None
+                    
+                    price = int(match.group(1).replace(',', '').replace('.', '')) / 100
+                    self._cache[market_hash_name] = price
+                    self._set_disk_cached(market_hash_name, price)
+                    logger.debug(f"Got Steam price for {market_hash_name}: ${price:.2f}")
+                    return price
                 
+                self._set_disk_cached(market_hash_name, None)
                 return None
                 
         except Exception as e:
             logger.error(f"Error fetching Steam price for {market_hash_name}: {e}")
             return None
     
-    async def get_prices_batch(self, market_hash_names: List[str], max_concurrent: int = 5) -> Dict[str, float]:
+    async def get_prices_batch(self, market_hash_names: List[str], max_concurrent: Optional[int] = None) -> Dict[str, float]:
         """Get prices for multiple items with concurrency control"""
         
+        max_concurrent = max_concurrent or self.max_concurrent
         logger.info(f"Fetching Steam prices for {len(market_hash_names)} items...")
         
-        # Create semaphore to limit concurrent requests
-        semaphore = asyncio.Semaphore(max_concurrent)
+        # Fixed worker pool fed from a bounded queue keeps memory at O(workers)
+        # instead of one coroutine per item; the rate limiter bounds the real QPS
+        worker_count = min(max_concurrent, len(market_hash_names))
+        queue = asyncio.Queue(maxsize=max_concurrent * 2)
+        prices = {}
+        
+        async def producer():
+            for name in market_hash_names:
+                await queue.put(name)
+            for _ in range(worker_count):
+                await queue.put(None)  # One stop sentinel per worker
+        
+        async def worker():
+            while True:
+                name = await queue.get()
+                if name is None:
+                    return
+                
+                try:
+                    price = await self.get_price(name)
+                except Exception as e:
+                    logger.error(f"Batch fetch error: {e}")
+                    continue
+                
+                if price is not None:
+                    prices[name] = price
         
-        async def fetch_single(name):
-            async with semaphore:
-                price = await self.get_price(name)
-                return name, price
+        await asyncio.gather(producer(), *(worker() for _ in range(worker_count)))
+        successful = len(prices)
         
-        # Execute all requests
-        tasks = [fetch_single(name) for name in market_hash_names]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
+        logger.info(f"Successfully fetched {successful}/{len(market_hash_names)} Steam prices")
+        return prices
+    
+    async def get_prices_via_search(self, query: str) -> Dict[str, float]:
+        """Get prices for every listing matching a search query in one request"""
         
-        # Process results
-        prices = {}
-        successful = 0
+        if not self._session:
+            raise RuntimeError("Must use async context manager (async with)")
         
-        for result in results:
-            if isinstance(result, Exception):
-                logger.error(f"Batch fetch error: {result}")
-                continue
-            
-            name, price = result
-            if price is not None:
+        params = {
+            'query': query,
+            'start': 0,
+            'count': self.search_page_size,
+            'norender': 1,
+            'search_descriptions': 0,
+            'appid': self.app_id,
+            'currency': self.currency
+        }
+        
+        try:
+            async with self._limiter, self._session.get(self.search_url, params=params) as response:
+                if response.status != 200:
+                    logger.warning(f"Steam search returned {response.status} for '{query}'")
+                    return {}
+                
+                data = _json_loads(await response.read())
+        except Exception as e:
+            logger.error(f"Error searching Steam Market for '{query}': {e}")
+            return {}
+        
+        if not data or not data.get('success'):
+            logger.debug(f"Steam search success=False for '{query}'")
+            return {}
+        
+        prices = {}
+        for result in data.get('results', []):
+            name = result.get('hash_name') or result.get('name')
+            sell_price = result.get('sell_price')  # Integer cents
+            if name and sell_price:
+                price = sell_price / 100
                 prices[name] = price
-                successful += 1
+                self._cache[name] = price
+                self._set_disk_cached(name, price)
         
-        logger.info(f"Successfully fetched {successful}/{len(market_hash_names)} Steam prices")
+        logger.debug(f"Steam search '{query}' returned {len(prices)} prices")
         return prices
     
+    @staticmethod
+    def _search_query_for(market_hash_name: str) -> str:
+        """Reduce a market hash name to the query shared by all its variants"""
+        name = _SEARCH_PREFIX_RE.sub('', market_hash_name)
+        return _WEAR_SUFFIX_RE.sub('', name).strip()
+    
     async def get_all_prices_for_skins(self, skin_names: List[str]) -> Dict[str, float]:
         """Get Steam Market prices for all provided skin names"""
         
-        logger.info(f"Building Steam Market pricing database for {len(skin_names)} skins...")
-        
-        # Filter out duplicates
-        unique_names = list(set(skin_names))
-        logger.info(f"Fetching prices for {len(unique_names)} unique items...")
+        # Normalize and deduplicate in one pass so padded duplicates are fetched once
+        unique_names = {name.strip() for name in skin_names}
+        logger.info(f"Building Steam Market pricing database for {len(unique_names)} unique items "
+                    f"({len(skin_names)} requested)...")
         
-        # Fetch prices in batches to avoid overwhelming Steam API
-        batch_size = 50
         all_prices = {}
+        pending = []
         
-        for i in range(0, len(unique_names), batch_size):
-            batch = unique_names[i:i + batch_size]
-            logger.info(f"Processing batch {i//batch_size + 1}/{(len(unique_names) + batch_size - 1)//batch_size}")
+        for name in unique_names:
+            if name in self._cache:
+                all_prices[name] = self._cache[name]
+                continue
+            
+            hit, price = self._get_disk_cached(name)
+            if hit:
+                if price is not None:
+                    all_prices[name] = price
+                continue
             
-            batch_prices = await self.get_prices_batch(batch)
-            all_prices.update(batch_prices)
+            pending.append(name)
+        
+        # Fast path: one search/render call prices every wear and StatTrak
+        # variant of a skin, instead of one priceoverview call per item
+        queries = {}
+        for name in pending:
+            queries.setdefault(self._search_query_for(name), []).append(name)
+        
+        logger.info(f"Searching Steam Market for {len(pending)} items via {len(queries)} queries...")
+        
+        # The session's connection pool bounds in-flight searches
+        search_results = await asyncio.gather(*(self.get_prices_via_search(q) for q in queries),
+                                              return_exceptions=True)
+        
+        for (query, names), result in zip(queries.items(), search_results):
+            if isinstance(result, Exception):
+                logger.error(f"Search fetch error for '{query}': {result}")
+                continue
             
-            # Progress update
-            logger.info(f"Progress: {len(all_prices)}/{len(unique_names)} prices collected")
+            for name in names:
+                if name in result:
+                    all_prices[name] = result[name]
+        
+        # Slow path: priceoverview for names the search did not match
+        misses = [name for name in pending if name not in all_prices]
+        logger.info(f"Search priced {len(pending) - len(misses)}/{len(pending)} items, "
+                    f"falling back to priceoverview for {len(misses)}")
+        
+        # One worker pool for every miss; max_concurrent and the shared limiter bound it globally
+        if misses:
+            all_prices.update(await self.get_prices_batch(misses))
         
         logger.info(f"Steam Market pricing complete: {len(all_prices)} prices collected")
         return all_prices
@@ -156,6 +379,9 @@ class SteamMarketPricingClient:
     def clear_cache(self):
         """Clear the price cache"""
         self._cache.clear()
+        if self._disk_cache is not None:
+            self._disk_cache.execute("DELETE FROM price_cache")
+            self._disk_cache.commit()
         logger.info("Steam Market price cache cleared")
 
 class SteamPricingAdapter:
@@ -164,34 +390,57 @@ class SteamPricingAdapter:
     def __init__(self):
         self.steam_client = SteamMarketPricingClient()
         self._prices_cache = {}
+        self._prices_view = types.MappingProxyType(self._prices_cache)
         self._initialized = False
     
-    async def get_all_prices(self) -> Dict[str, float]:
-        """Get all prices - requires prior initialization with skin list"""
+    async def __aenter__(self):
+        """Open the Steam client session for the adapter's lifetime"""
+        await self._ensure_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the shared Steam client session"""
+        await self.close()
+    
+    async def _ensure_session(self):
+        """Lazily open one session so every call reuses its connection pool"""
+        if self.steam_client._session is None:
+            await self.steam_client.__aenter__()
+    
+    async def close(self):
+        """Close the shared Steam client session"""
+        if self.steam_client._session is not None:
+            await self.steam_client.__aexit__(None, None, None)
+    
+    async def get_all_prices(self) -> Mapping[str, float]:
+        """Get all prices - requires prior initialization with skin list
+        
+        Returns a read-only view; callers that need to mutate must copy it.
+        """
         if not self._initialized:
             raise RuntimeError("Must call initialize_with_skins() first")
         
-        return self._prices_cache.copy()
+        return self._prices_view
     
     async def get_sample_prices(self, limit: int = 1000) -> Dict[str, float]:
         """Get sample of prices"""
         all_prices = await self.get_all_prices()
-        items = list(all_prices.items())[:limit]
-        return dict(items)
+        return dict(islice(all_prices.items(), limit))
     
     async def initialize_with_skins(self, skin_names: List[str]) -> None:
         """Initialize the Steam pricing with a list of skin names"""
         
-        async with self.steam_client:
-            self._prices_cache = await self.steam_client.get_all_prices_for_skins(skin_names)
-            self._initialized = True
+        await self._ensure_session()
+        self._prices_cache = await self.steam_client.get_all_prices_for_skins(skin_names)
+        self._prices_view = types.MappingProxyType(self._prices_cache)
+        self._initialized = True
         
         logger.info(f"Steam pricing adapter initialized with {len(self._prices_cache)} prices")
     
     async def fetch_prices(self, item_names: List[str]) -> Dict[str, float]:
         """Fetch prices for specific items"""
-        async with self.steam_client:
-            return await self.steam_client.get_prices_batch(item_names)
+        await self._ensure_session()
+        return await self.steam_client.get_prices_batch(item_names)
     
     def get_cached_price(self, item_name: str) -> Optional[float]:
         """Get cached price for an item"""
@@ -201,74 +450,106 @@ class SteamPricingAdapter:
 class SteamPricingClient:
     """Client that uses the Steam pricing database as a pricing source"""
     
+    # Statements are reused verbatim so sqlite3's per-connection statement
+    # cache keeps them prepared across calls
+    ALL_PRICES_SQL = """
+        SELECT market_hash_name, steam_price
+        FROM steam_prices 
+        WHERE success = 1 AND steam_price IS NOT NULL
+    """
+    SAMPLE_PRICES_SQL = """
+        SELECT market_hash_name, steam_price
+        FROM steam_prices 
+        WHERE success = 1 AND steam_price IS NOT NULL
+        ORDER BY RANDOM()
+        LIMIT ?
+    """
+    SINGLE_PRICE_SQL = """
+        SELECT steam_price
+        FROM steam_prices 
+        WHERE market_hash_name = ? AND success = 1 AND steam_price IS NOT NULL
+    """
+    PRICING_STATS_SQL = """
+        SELECT COUNT(*), AVG(steam_price)
+        FROM steam_prices 
+        WHERE success = 1
+    """
+    
     def __init__(self, db_path: str = None):
-        from pathlib import Path
         self.db_path = db_path or Path("data/steam_pricing.db")
         if not Path(self.db_path).exists():
             raise FileNotFoundError(f"Steam pricing database not found at {self.db_path}. Run build_steam_pricing_database.py first.")
+        
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.executescript("""
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA cache_size=-65536;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            CREATE INDEX IF NOT EXISTS idx_steam_prices_priced
+            ON steam_prices(market_hash_name) WHERE success = 1 AND steam_price IS NOT NULL;
+            CREATE INDEX IF NOT EXISTS idx_steam_prices_success_price
+            ON steam_prices(success, steam_price);
+        """)
+    
+    def close(self):
+        """Close the cached database connection"""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+    
+    def __del__(self):
+        conn = getattr(self, '_conn', None)
+        if conn is not None:
+            conn.close()
+    
+    def iter_all_prices(self, chunk_size: int = 10000) -> Iterator[Tuple[str, float]]:
+        """Stream (market_hash_name, price) rows in fetchmany chunks"""
+        cursor = self._conn.execute(self.ALL_PRICES_SQL)
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield from rows
     
     async def get_all_prices(self) -> Dict[str, float]:
         """Get all available Steam prices from database"""
-        import sqlite3
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT market_hash_name, steam_price
-            FROM steam_prices 
-            WHERE success = 1 AND steam_price IS NOT NULL
-        """)
-        
-        prices = dict(cursor.fetchall())
-        conn.close()
+        prices = dict(self.iter_all_prices())
         
         logger.info(f"Loaded {len(prices)} Steam prices from database")
         return prices
     
     async def get_sample_prices(self, limit: int = 1000) -> Dict[str, float]:
         """Get sample of Steam prices from database"""
-        import sqlite3
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT market_hash_name, steam_price
-            FROM steam_prices 
-            WHERE success = 1 AND steam_price IS NOT NULL
-            ORDER BY RANDOM()
-            LIMIT ?
-        """, (limit,))
-        
-        prices = dict(cursor.fetchall())
-        conn.close()
+        prices = dict(self._conn.execute(self.SAMPLE_PRICES_SQL, (limit,)).fetchall())
         
         logger.info(f"Loaded {len(prices)} sample Steam prices from database")
         return prices
     
     async def fetch_prices_for_items(self, item_names: List[str]) -> Dict[str, float]:
         """Fetch prices for specific items from database"""
-        import sqlite3
-        
         if not item_names:
             return {}
         
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        # Create placeholders for the query
-        placeholders = ','.join(['?' for _ in item_names])
-        
-        cursor.execute(f"""
-            SELECT market_hash_name, steam_price
-            FROM steam_prices 
-            WHERE market_hash_name IN ({placeholders})
-            AND success = 1 AND steam_price IS NOT NULL
-        """, item_names)
+        # Join against a temp table instead of a giant IN (?, ?, ...) list so
+        # the query stays under SQLite's variable limit and its plan is stable
+        cursor = self._conn.cursor()
+        cursor.execute("CREATE TEMP TABLE IF NOT EXISTS requested_items (name TEXT PRIMARY KEY)")
+        cursor.executemany("INSERT OR IGNORE INTO requested_items (name) VALUES (?)",
+                           ((name,) for name in item_names))
         
-        prices = dict(cursor.fetchall())
-        conn.close()
+        try:
+            cursor.execute("""
+                SELECT s.market_hash_name, s.steam_price
+                FROM steam_prices s
+                JOIN requested_items q ON q.name = s.market_hash_name
+                WHERE s.success = 1 AND s.steam_price IS NOT NULL
+            """)
+            prices = dict(cursor.fetchall())
+        finally:
+            cursor.execute("DELETE FROM requested_items")
+            self._conn.commit()
         
         logger.debug(f"Fetched {len(prices)}/{len(item_names)} Steam prices for specific items")
         return prices
@@ -276,19 +557,7 @@ class SteamPricingClient:
     async def validate_and_correct_price(self, market_hash_name: str, external_price: float, 
                                        rarity: str, tolerance_percent: float = 20.0) -> Optional[float]:
         """Validate external price against Steam price"""
-        import sqlite3
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        cursor.execute("""
-            SELECT steam_price
-            FROM steam_prices 
-            WHERE market_hash_name = ? AND success = 1 AND steam_price IS NOT NULL
-        """, (market_hash_name,))
-        
-        result = cursor.fetchone()
-        conn.close()
+        result = self._conn.execute(self.SINGLE_PRICE_SQL, (market_hash_name,)).fetchone()
         
         if result:
             steam_price = float(result[0])
@@ -301,24 +570,13 @@ class SteamPricingClient:
     
     def get_pricing_stats(self) -> Dict:
         """Get statistics about the Steam pricing database"""
-        import sqlite3
-        
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        stats = {}
+        # One scan for both aggregates; AVG already skips NULL prices
+        total_prices, avg_price = self._conn.execute(self.PRICING_STATS_SQL).fetchone()
         
-        # Total successful prices
-        cursor.execute("SELECT COUNT(*) FROM steam_prices WHERE success = 1")
-        stats['total_prices'] = cursor.fetchone()[0]
-        
-        # Average price
-        cursor.execute("SELECT AVG(steam_price) FROM steam_prices WHERE success = 1 AND steam_price IS NOT NULL")
-        avg_price = cursor.fetchone()[0]
-        stats['average_price'] = float(avg_price) if avg_price else 0.0
-        
-        conn.close()
-        return stats
+        return {
+            'total_prices': total_prices,
+            'average_price': float(avg_price) if avg_price else 0.0
+        }
 
 # Test function
 async def test_steam_pricing():
@@ -5,7 +5,10 @@ Coordinates data fetching, caching, calculations, and result formatting.
 
 import asyncio
 import logging
-from typing import List, Optional
+from collections import Counter
+from heapq import nlargest
+from operator import attrgetter
+from typing import Iterator, List, Optional
 from decimal import Decimal
 
 from .config import config
@@ -16,6 +19,18 @@ from .models import MarketData, TradeUpResult
 
 logger = logging.getLogger(__name__)
 
+_DEC0 = Decimal('0')
+_DEC_CACHE = {}
+
+def _to_decimal(value: float) -> Decimal:
+    """Convert a float threshold to Decimal, reusing previous conversions"""
+    if not value:
+        return _DEC0
+    dec = _DEC_CACHE.get(value)
+    if dec is None:
+        dec = _DEC_CACHE.setdefault(value, Decimal(str(value)))
+    return dec
+
 class TradeUpFinder:
     """Main application class coordinating all components"""
     def __init__(self, use_mock_data: bool = False, use_profitable_mock: bool = False, limit_items: Optional[int] = None, use_csfloat: bool = False):
@@ -24,10 +39,13 @@ class TradeUpFinder:
         self.db_manager = DatabaseManager()
         self.calculator = None
         self.market_data = None
+        self._summary_cache = None
+        self._summary_source = None  # market_data the cached summary was built from
     
     async def initialize(self, force_refresh: bool = False) -> None:
         """Initialize the system with market data"""
         logger.info("Initializing CS2 Trade-up Calculator...")
+        self._summary_cache = None
           # If using mock data, always fetch fresh mock data
         if self.api_client.use_mock_data:
             logger.info("Using mock data - fetching fresh data")
@@ -66,6 +84,46 @@ class TradeUpFinder:
         self.db_manager.cache_skins(skins)
         logger.info(f"Cached {len(skins)} skins to database")
     
+    def _find_candidates(
+        self,
+        min_profit: float,
+        max_input_price: Optional[float],
+        target_collections: Optional[List[str]]
+    ) -> List[TradeUpCandidate]:
+        """Convert parameters and run the calculator's candidate search"""
+        if not self.calculator:
+            raise RuntimeError("System not initialized. Call initialize() first.")
+        
+        # Convert parameters
+        min_profit_decimal = _to_decimal(min_profit)
+        max_price_decimal = _to_decimal(max_input_price) if max_input_price else None
+        
+        return self.calculator.find_profitable_tradeups(
+            min_profit=min_profit_decimal,
+            max_input_price=max_price_decimal,
+            target_collections=target_collections
+        )
+    
+    def iter_profitable_trades(
+        self,
+        min_profit: float = 0.0,
+        max_input_price: Optional[float] = None,
+        target_collections: Optional[List[str]] = None,
+        limit: int = 20
+    ) -> Iterator[TradeUpResult]:
+        """
+        Lazily yield profitable trade-up results
+        
+        Detailed results are only calculated as the caller consumes them, so
+        callers that stop early never pay for the discarded candidates.
+        Arguments match find_profitable_trades.
+        """
+        candidates = self._find_candidates(min_profit, max_input_price, target_collections)
+        
+        # Convert to detailed results on demand
+        for candidate in candidates[:limit]:
+            yield self.calculator.calculate_detailed_result(candidate)
+    
     async def find_profitable_trades(
         self,
         min_profit: float = 0.0,
@@ -85,27 +143,12 @@ class TradeUpFinder:
         Returns:
             List of profitable trade-up results
         """
-        if not self.calculator:
-            raise RuntimeError("System not initialized. Call initialize() first.")
-        
         logger.info(f"Searching for profitable trade-ups (min_profit=${min_profit})")
         
-        # Convert parameters
-        min_profit_decimal = Decimal(str(min_profit))
-        max_price_decimal = Decimal(str(max_input_price)) if max_input_price else None
-        
-        # Find candidates
-        candidates = self.calculator.find_profitable_tradeups(
-            min_profit=min_profit_decimal,
-            max_input_price=max_price_decimal,
-            target_collections=target_collections
-        )
+        candidates = self._find_candidates(min_profit, max_input_price, target_collections)
         
         # Convert to detailed results
-        results = []
-        for candidate in candidates[:limit]:
-            result = self.calculator.calculate_detailed_result(candidate)
-            results.append(result)
+        results = [self.calculator.calculate_detailed_result(candidate) for candidate in candidates[:limit]]
         
         logger.info(f"Found {len(results)} profitable trade-up opportunities")
         return results
@@ -118,20 +161,10 @@ class TradeUpFinder:
     ) -> List[TradeUpResult]:
         """Find trade-ups with guaranteed profit (all outputs profitable)"""
         
-        if not self.calculator:
-            raise RuntimeError("System not initialized. Call initialize() first.")
-        
         logger.info("Searching for guaranteed profit trade-ups")
         
-        # Convert parameters
-        max_price_decimal = Decimal(str(max_input_price)) if max_input_price else None
-        
         # Find all candidates
-        candidates = self.calculator.find_profitable_tradeups(
-            min_profit=Decimal('0'),
-            max_input_price=max_price_decimal,
-            target_collections=target_collections
-        )
+        candidates = self._find_candidates(0, max_input_price, target_collections)
         
         # Filter for guaranteed profit only
         guaranteed_candidates = [
@@ -139,17 +172,11 @@ class TradeUpFinder:
             if c.guaranteed_profit and c.guaranteed_profit > 0
         ]
         
-        # Sort by guaranteed profit
-        guaranteed_candidates.sort(
-            key=lambda c: c.guaranteed_profit, 
-            reverse=True
-        )
+        # Select the top candidates by guaranteed profit without sorting them all
+        top_candidates = nlargest(limit, guaranteed_candidates, key=attrgetter('guaranteed_profit'))
         
         # Convert to results
-        results = []
-        for candidate in guaranteed_candidates[:limit]:
-            result = self.calculator.calculate_detailed_result(candidate)
-            results.append(result)
+        results = [self.calculator.calculate_detailed_result(candidate) for candidate in top_candidates]
         
         logger.info(f"Found {len(results)} guaranteed profit trade-ups")
         return results
@@ -159,20 +186,24 @@ class TradeUpFinder:
         if not self.market_data:
             return {}
         
+        # market_data only changes on initialize(), so reuse the last summary
+        # unless it was built from a different market_data object
+        if self._summary_cache is not None and self._summary_source is self.market_data:
+            return self._summary_cache
+        
+        skins_by_rarity = Counter()
+        for collection in self.market_data.collections.values():
+            skins_by_rarity.update(collection.skin_count_by_rarity)
+        
         summary = {
             'total_collections': len(self.market_data.collections),
-            'total_skins': 0,
-            'skins_by_rarity': {},
+            'total_skins': sum(skins_by_rarity.values()),
+            'skins_by_rarity': dict(skins_by_rarity),
             'last_updated': self.market_data.last_updated
         }
         
-        for collection in self.market_data.collections.values():
-            for rarity, skins in collection.skins_by_rarity.items():
-                summary['total_skins'] += len(skins)
-                if rarity not in summary['skins_by_rarity']:
-                    summary['skins_by_rarity'][rarity] = 0
-                summary['skins_by_rarity'][rarity] += len(skins)
-        
+        self._summary_cache = summary
+        self._summary_source = self.market_data
         return summary
     
     def get_available_collections(self) -> List[str]:
@@ -9,6 +9,7 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from src.comprehensive_trade_finder import ComprehensiveTradeUpFinder
+from src.asyncio_setup import run
 
 async def test_bypass_validation():
     print("Testing trade-up with bypassed price validation...")
@@ -20,7 +21,11 @@ async def test_bypass_validation():
         
         # Test collection with known working data
         test_collection = "The 2018 Inferno Collection"
-        consumer_skins = finder.db_manager.get_skins_by_collection_and_rarity(test_collection, 'Consumer Grade')
+        # Input and output lookups are independent blocking queries; run them on threads together
+        consumer_skins, output_skins = await asyncio.gather(
+            asyncio.to_thread(finder.db_manager.get_skins_by_collection_and_rarity, test_collection, 'Consumer Grade'),
+            asyncio.to_thread(finder.db_manager.get_skins_by_collection_and_rarity, test_collection, 'Industrial Grade')
+        )
         
         print(f"Testing collection: {test_collection}")
         print(f"Consumer skins: {len(consumer_skins)}")
@@ -38,21 +43,21 @@ async def test_bypass_validation():
         # Now try a modified calculation that bypasses validation
         print("\n=== Manual calculation bypassing validation ===")
         
-        # Find cheapest consumer skin
-        cheapest_price = float('inf')
-        cheapest_skin = None
-        for skin in consumer_skins:
-            price = finder._cached_prices.get(skin['market_hash_name'])
-            if price and float(price) <= 10.0:  # max_input_price
-                if float(price) < cheapest_price:
-                    cheapest_price = float(price)
-                    cheapest_skin = skin
+        # Find cheapest consumer skin (one lookup and one float() per skin)
+        priced_skins = (
+            (skin, float(price)) for skin in consumer_skins
+            if (price := finder._cached_prices.get(skin['market_hash_name']))
+        )
+        cheapest_skin, cheapest_price = min(
+            ((skin, price) for skin, price in priced_skins if price <= 10.0),  # max_input_price
+            key=lambda pair: pair[1],
+            default=(None, float('inf'))
+        )
         
         if cheapest_skin:
             print(f"Cheapest input: {cheapest_skin['market_hash_name']} @ ${cheapest_price}")
             
-            # Get outputs
-            output_skins = finder.db_manager.get_skins_by_collection_and_rarity(test_collection, 'Industrial Grade')
+            # Outputs were fetched alongside the inputs above
             marketable_outputs = [skin for skin in output_skins if finder._is_marketable_skin(skin)]
               # Calculate expected output value WITHOUT validation checks
             total_cost = cheapest_price * 10
@@ -90,4 +95,4 @@ async def test_bypass_validation():
         print(traceback.format_exc())
 
 if __name__ == "__main__":
-    asyncio.run(test_bypass_validation())
+    run(test_bypass_validation())
@@ -5,15 +5,20 @@ Test script to verify the complete workflow:
 3. Validate trade-up calculation end-to-end
 """
 
-import asyncio
+import operator
 import sys
+from itertools import chain
 from pathlib import Path
 
 # Add src to path for imports
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from src.comprehensive_trade_finder import ComprehensiveTradeUpFinder
+from src.float_scaling_numba import make_scaler
 from src.logging_config import setup_logging
+from src.asyncio_setup import run
+
+_input_fields = operator.attrgetter('name', 'quantity', 'price')
 
 async def test_complete_workflow():
     """Test the complete workflow with all pricing data"""
@@ -40,34 +45,26 @@ async def test_complete_workflow():
     target_weapon = "AK-47"
     target_skin = "Redline"
     
-    # Search through market data to find this skin
-    redline_skin = None
-    for collection_data in finder.market_data.collections.values():
-        for rarity_list in collection_data.skins_by_rarity.values():
-            for skin in rarity_list:
-                if target_weapon in skin.name and target_skin in skin.name:
-                    redline_skin = skin
-                    break
-            if redline_skin:
-                break
-        if redline_skin:
-            break    
+    # Look up the skin in the market data's (weapon, skin) index
+    redline_skin = finder.market_data.get_skin_by_weapon(target_weapon, target_skin)
+    if redline_skin is None:
+        # Fall back to a substring scan over every skin, stopping at the first hit
+        all_skins = chain.from_iterable(
+            rarity_skins
+            for collection_data in finder.market_data.collections.values()
+            for rarity_skins in collection_data.skins_by_rarity.values()
+        )
+        redline_skin = next((skin for skin in all_skins
+                             if target_weapon in skin.name and target_skin in skin.name), None)
     if redline_skin:
         print(f"🎯 Found: {redline_skin.name}")
         print(f"   Float Range: {redline_skin.float_min} - {redline_skin.float_max}")
           # Test float scaling
         input_float = 0.265  # Field-Tested midpoint
         
-        # Convert Skin object to expected dictionary format
-        output_skin_dict = {
-            'market_hash_name': redline_skin.name,
-            'min_float': redline_skin.float_min,
-            'max_float': redline_skin.float_max
-        }
-        
-        scaled_result = finder._calculate_output_float_and_condition(
-            input_float, output_skin_dict
-        )
+        # Bind the skin's float range once instead of packing it into a dict
+        scale = make_scaler(redline_skin.float_min, redline_skin.float_max)
+        scaled_result = scale(input_float)
         
         if scaled_result:
             scaled_float, predicted_condition = scaled_result
@@ -99,8 +96,8 @@ async def test_complete_workflow():
         
         # Show input skins
         print("   Input Skins:")
-        for input_skin in result.input_skins:
-            print(f"     - {input_skin.name} x{input_skin.quantity} @ ${input_skin.price:.2f}")
+        print('\n'.join(f"     - {name} x{quantity} @ ${price:.2f}"
+                        for name, quantity, price in map(_input_fields, result.input_skins)))
             
         # Show possible outputs with float predictions
         print("   Possible Outputs:")
@@ -117,7 +114,7 @@ async def test_complete_workflow():
         print("\n🔍 Checking for ANY trade-ups (profit/loss doesn't matter)...")
         
         # Manual check - look at first collection and try to find any valid trade-up inputs
-        first_collection = list(finder.market_data.collections.values())[0]
+        first_collection = next(iter(finder.market_data.collections.values()))
         print(f"   Checking collection: {first_collection.name}")
         
         # Check if we have enough pricing data for consumer grade skins
@@ -134,4 +131,4 @@ async def test_complete_workflow():
     print("🏁 Workflow Test Complete")
 
 if __name__ == "__main__":
-    asyncio.run(test_complete_workflow())
+    run(test_complete_workflow())
@@ -1,15 +1,19 @@
 #!/usr/bin/env python3
 """Test the fixed comprehensive trade finder"""
 
-import asyncio
 import sys
 import os
 import argparse
+import heapq
+import operator
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
 from comprehensive_trade_finder import ComprehensiveTradeUpFinder
+from asyncio_setup import run
+
+_output_fields = operator.attrgetter('skin.name', 'probability', 'skin.price', 'skin.collection')
 
 async def main(stop_after_one=False):
     try:
@@ -42,13 +46,15 @@ async def main(stop_after_one=False):
             print(f"Number of Possible Outputs: {len(trade.output_skins)}")
             
             print("\nTop Output Possibilities:")
-            # Sort outputs by probability
-            sorted_outputs = sorted(trade.output_skins, key=lambda x: x.probability, reverse=True)
-            for j, output in enumerate(sorted_outputs[:3]):
-                print(f"  {j+1}. {output.skin.name}")
-                print(f"     Probability: {output.probability:.3f} ({output.probability*100:.1f}%)")
-                print(f"     Price: ${output.skin.price:.2f}")
-                print(f"     Collection: {output.skin.collection}")
+            # Only the three most likely outputs are shown
+            top_outputs = heapq.nlargest(3, trade.output_skins, key=operator.attrgetter('probability'))
+            print('\n'.join(
+                f"  {j}. {name}\n"
+                f"     Probability: {probability:.3f} ({probability*100:.1f}%)\n"
+                f"     Price: ${price:.2f}\n"
+                f"     Collection: {collection}"
+                for j, (name, probability, price, collection) in enumerate(map(_output_fields, top_outputs), 1)
+            ))
         
         print("\n=== Test Complete ===")
         
@@ -63,4 +69,4 @@ if __name__ == "__main__":
                        help='Stop after finding just one profitable trade-up')
     args = parser.parse_args()
     
-    asyncio.run(main(stop_after_one=args.stop_after_one))
+    run(main(stop_after_one=args.stop_after_one))
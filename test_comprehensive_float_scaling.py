@@ -6,7 +6,10 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+import numpy as np
+
 from src.comprehensive_trade_finder import ComprehensiveTradeUpFinder
+from src.float_scaling_numba import CONDITIONS
 
 def test_comprehensive_float_scaling():
     """Test float scaling with realistic CS2 skin examples"""
@@ -55,19 +58,23 @@ def test_comprehensive_float_scaling():
         (0.725, "Battle-Scarred")
     ]
     
-    for skin in output_skins:
+    # Scale every input condition onto every output skin in one broadcast
+    input_floats = np.array([input_float for input_float, _ in input_conditions])
+    mins = np.array([skin['min_float'] for skin in output_skins])
+    maxs = np.array([skin['max_float'] for skin in output_skins])
+    scaled_floats, condition_indices = finder.scale_floats_batch(input_floats, mins, maxs)
+    
+    for skin_index, skin in enumerate(output_skins):
         print(f"🔫 {skin['name']} ({skin['note']})")
         print(f"   Float Range: {skin['min_float']:.3f} - {skin['max_float']:.3f}")
         print()
         print("   Input Condition    → Output Float    → Output Condition")
         print("   " + "-" * 55)
         
-        for input_float, input_condition in input_conditions:
-            scaled_float, predicted_condition = finder._calculate_output_float_and_condition(
-                input_float, skin
-            )
-            
-            print(f"   {input_condition:15} → {scaled_float:11.6f} → {predicted_condition}")
+        for (_, input_condition), scaled_float, condition_index in zip(
+            input_conditions, scaled_floats[:, skin_index], condition_indices[:, skin_index]
+        ):
+            print(f"   {input_condition:15} → {scaled_float:11.6f} → {CONDITIONS[condition_index]}")
         
         print()
     
@@ -2,13 +2,17 @@
 Test getting more comprehensive pricing data
 """
 
-import asyncio
+import os
 import sys
 from pathlib import Path
 
+# Reuse a local price snapshot (refreshed at most daily) instead of hitting the API every run
+os.environ.setdefault('CSTA_PRICE_CACHE', 'data/prices.npz')
+
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from src.runtime_pricing import RuntimePricingClient
+from src.asyncio_setup import run
 
 async def test_comprehensive_pricing():
     print("Testing comprehensive pricing data...")
@@ -44,7 +48,7 @@ async def test_comprehensive_pricing():
         
         # Try to load ALL prices if possible
         print(f"\nTrying to load ALL available prices...")
-        await client._load_all_prices()
+        await client._ensure_price_cache_loaded()
         all_prices = client._price_cache
         print(f"Full cache has {len(all_prices)} prices")
         
@@ -89,4 +93,4 @@ async def test_comprehensive_pricing():
         print(traceback.format_exc())
 
 if __name__ == "__main__":
-    asyncio.run(test_comprehensive_pricing())
+    run(test_comprehensive_pricing())
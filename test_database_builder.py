@@ -4,16 +4,26 @@ Test script for the comprehensive database builder
 Tests with PriceEmpire API and builds a sample database
 """
 
-import asyncio
 import json
+import re
 from pathlib import Path
 import sys
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:  # orjson is optional; stdlib json also accepts bytes
+    _json_loads = json.loads
+
+# Whole-line // comments in config/config.json
+_COMMENT_RE = re.compile(rb'(?m)^\s*//.*$')
+
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from build_comprehensive_database import ComprehensiveDatabaseBuilder
 from src.logging_config import setup_logging
+from src.asyncio_setup import run
 
 
 async def test_api_access(api_key: str):
@@ -94,14 +104,9 @@ def load_api_key_from_config() -> str:
         return ""
     
     try:
-        with open(config_path, 'r') as f:
+        with open(config_path, 'rb') as f:
             # Remove comments from JSON
-            content = f.read()
-            lines = content.split('\n')
-            clean_lines = [line for line in lines if not line.strip().startswith('//')]
-            clean_content = '\n'.join(clean_lines)
-            
-            config = json.loads(clean_content)
+            config = _json_loads(_COMMENT_RE.sub(b'', f.read()))
             return config.get('api', {}).get('pricempire_api_key', '')
     except Exception as e:
         print(f"⚠️ Could not load API key from config: {e}")
@@ -156,4 +161,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -2,9 +2,16 @@
 Test script to verify that the trade finder only returns trade-ups with validated pricing
 """
 
-import asyncio
 import logging
+import os
+
+# Reuse a local price snapshot (refreshed at most daily) instead of hitting the API every run
+os.environ.setdefault('CSTA_PRICE_CACHE', 'data/prices.npz')
+# Keep compiled numba kernels between runs so only the first run pays for compilation
+os.environ.setdefault('NUMBA_CACHE_DIR', 'data/numba_cache')
+
 from src.comprehensive_trade_finder import ComprehensiveTradeUpFinder
+from src.asyncio_setup import run
 
 # Configure logging to see the validation process
 logging.basicConfig(level=logging.INFO)
@@ -42,4 +49,4 @@ async def main():
         print("This may indicate successful filtering is preventing invalid trade-ups")
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
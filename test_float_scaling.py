@@ -4,6 +4,7 @@ Test script to verify float scaling implementation
 
 import sys
 import os
+import numpy as np
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
 from src.comprehensive_trade_finder import ComprehensiveTradeUpFinder
@@ -41,11 +42,13 @@ def test_float_scaling():
     print("Input Float → Scaled Output Float (Condition)")
     print("-" * 50)
     
-    for input_float, input_condition in test_inputs:
-        scaled_float, predicted_condition = finder._calculate_output_float_and_condition(
-            input_float, test_output_skin
-        )
-        
+    # Scale every test input in one vectorized call
+    input_floats = np.array([input_float for input_float, _ in test_inputs])
+    scaled_floats, predicted_conditions = finder._calculate_output_float_and_condition_batch(
+        input_floats, test_output_skin
+    )
+    
+    for (input_float, input_condition), scaled_float, predicted_condition in zip(test_inputs, scaled_floats, predicted_conditions):
         print(f"{input_float:.3f} ({input_condition}) → {scaled_float:.6f} ({predicted_condition})")
     
     print()
@@ -65,10 +68,10 @@ def test_float_scaling():
     }
     
     print(f"Full Range Skin (0.0 - 1.0):")
-    for input_float, input_condition in test_inputs[:3]:  # Test first 3
-        scaled_float, predicted_condition = finder._calculate_output_float_and_condition(
-            input_float, full_range_skin
-        )
+    scaled_floats, predicted_conditions = finder._calculate_output_float_and_condition_batch(
+        input_floats[:3], full_range_skin  # Test first 3
+    )
+    for input_float, scaled_float, predicted_condition in zip(input_floats[:3], scaled_floats, predicted_conditions):
         print(f"  {input_float:.3f} → {scaled_float:.6f} ({predicted_condition})")
 
 if __name__ == "__main__":
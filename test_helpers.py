@@ -0,0 +1,97 @@
+"""
+Shared display helpers for the trade-up test scripts
+"""
+
+import sys
+
+def display_trade_up_analysis(result):
+    """Display comprehensive trade-up analysis results"""
+    # One write for the whole report instead of one per line
+    sys.stdout.write(format_trade_up_analysis(result) + "\n")
+
+def format_trade_up_analysis(result) -> str:
+    """Build the comprehensive trade-up analysis report as a single string"""
+    lines = []
+    
+    lines.append(f"📋 Trade Type: {result['trade_type']}")
+    lines.append(f"📦 Input Collection: {result['input_collection']}")
+    lines.append(f"📈 {result['input_rarity']} → {result['output_rarity']}")
+    lines.append("")
+    
+    # Financial Summary
+    lines.append("💰 FINANCIAL ANALYSIS")
+    lines.append("-" * 40)
+    financial = result['financial_summary']
+    lines.append(f"Total Input Cost:     ${financial['total_input_cost']:.2f}")
+    lines.append(f"Expected Output:      ${financial['expected_output_value']:.2f}")
+    lines.append(f"After Selling Fees:   ${financial['net_expected_value_after_fees']:.2f}")
+    lines.append(f"Expected Profit:      ${financial['expected_profit']:.2f}")
+    lines.append(f"ROI:                  {financial['roi_percentage']:.1f}%")
+    lines.append(f"Selling Fee Rate:     {financial['selling_fee_rate']*100:.0f}%")
+    lines.append("")
+    
+    # Input Item Details
+    lines.append("🛒 PURCHASE REQUIREMENTS")
+    lines.append("-" * 40)
+    input_info = result['input_skin']
+    lines.append(f"Item: {input_info['name']}")
+    lines.append(f"Quantity: {input_info['quantity_needed']} items")
+    lines.append(f"Platform: {result['purchase_instructions']['platform']}")
+    lines.append("")
+    
+    # Purchase Plan
+    purchase_info = input_info['purchase_info']
+    if purchase_info['available']:
+        lines.append("📋 PURCHASE PLAN:")
+        lines.extend(
+            f"  {i:2d}. ${item['price']:.2f} - Float: {item['float']:.4f} - Seller: {item['seller']}\n"
+            f"      URL: {item['url']}"
+            for i, item in enumerate(purchase_info['purchase_plan'], 1)
+        )
+        lines.append(f"\nTotal Cost: ${purchase_info['total_cost']:.2f}")
+    else:
+        lines.append("❌ Not enough items available for purchase")
+    lines.append("")
+    
+    # Float Analysis
+    lines.append("🎯 FLOAT ANALYSIS")
+    lines.append("-" * 40)
+    float_info = result['float_analysis']
+    lines.append(f"Input Floats: {', '.join(f'{f:.4f}' for f in float_info['input_floats'])}")
+    lines.append(f"Average Input Float: {float_info['average_input_float']:.4f}")
+    lines.append(f"Scaled Average: {float_info['scaled_average_float']:.4f}")
+    lines.append(f"Wear Conditions: {', '.join(dict.fromkeys(float_info['input_wear_conditions']))}")
+    lines.append("")
+    
+    # Output Possibilities
+    lines.append("🎲 POSSIBLE OUTPUTS")
+    lines.append("-" * 40)
+    lines.extend(
+        f"{i}. {output['name']}\n"
+        f"   Probability: {output['probability']*100:.1f}%\n"
+        f"   CSFloat Price: ${output['csfloat_price']:.2f}\n"
+        f"   Expected Float: {output['expected_float']:.4f} ({output['wear_condition']})\n"
+        f"   Sample Listings:\n"
+        + "".join(f"     {j}. ${listing['price']:.2f} - Float: {listing['float']:.4f}\n"
+                  for j, listing in enumerate(output['listings'], 1))
+        for i, output in enumerate(result['output_possibilities'], 1)
+    )
+    
+    # Instructions
+    lines.append("📝 EXECUTION INSTRUCTIONS")
+    lines.append("-" * 40)
+    instructions = result['purchase_instructions']
+    lines.append(f"1. Visit {instructions['platform']} marketplace")
+    lines.append(f"2. Purchase {instructions['total_items_needed']} items as listed above")
+    lines.append(f"3. Execute trade-up contract in CS:GO")
+    lines.append(f"4. Sell output on Steam Community Market")
+    lines.append(f"5. Estimated time: {instructions['estimated_completion_time']}")
+    lines.append("")
+    
+    lines.append("⚠️  IMPORTANT NOTES:")
+    lines.append("• Prices are real-time and may change")
+    lines.append("• Market fees reduce final profit")
+    lines.append("• Trade-up outcomes are probabilistic")
+    lines.append("• Float values affect final item condition")
+    
+    return "\n".join(lines)
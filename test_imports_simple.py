@@ -3,6 +3,7 @@
 Simple test to check if imports work
 """
 
+import importlib
 import sys
 from pathlib import Path
 import asyncio
@@ -10,24 +11,30 @@ import asyncio
 # Add src to path
 sys.path.append(str(Path(__file__).parent / "src"))
 
+from asyncio_setup import run
+
 async def test_imports():
     try:
         print("Testing imports...")
         
-        # Test database manager
-        from comprehensive_database import ComprehensiveDatabaseManager
+        # Import the heavy modules on worker threads so their disk/extension loading overlaps
+        database_mod, pricing_mod, listings_mod, finder_mod = await asyncio.gather(
+            asyncio.to_thread(importlib.import_module, "comprehensive_database"),
+            asyncio.to_thread(importlib.import_module, "runtime_pricing"),
+            asyncio.to_thread(importlib.import_module, "csfloat_listings"),
+            asyncio.to_thread(importlib.import_module, "comprehensive_trade_finder")
+        )
+        
+        ComprehensiveDatabaseManager = database_mod.ComprehensiveDatabaseManager
         print("✅ ComprehensiveDatabaseManager imported")
         
-        # Test runtime pricing
-        from runtime_pricing import RuntimePricingClient
+        RuntimePricingClient = pricing_mod.RuntimePricingClient
         print("✅ RuntimePricingClient imported")
         
-        # Test CSFloat client
-        from csfloat_listings import CSFloatListingsClient
+        CSFloatListingsClient = listings_mod.CSFloatListingsClient
         print("✅ CSFloatListingsClient imported")
         
-        # Test comprehensive finder
-        from comprehensive_trade_finder import ComprehensiveTradeUpFinder
+        ComprehensiveTradeUpFinder = finder_mod.ComprehensiveTradeUpFinder
         print("✅ ComprehensiveTradeUpFinder imported")
         
         # Try to initialize
@@ -37,7 +44,7 @@ async def test_imports():
         
         # Test getting some basic info
         print("\nTesting database access...")
-        tradeable_skins = db_manager.get_all_tradeable_skins()
+        tradeable_skins = await asyncio.to_thread(db_manager.get_all_tradeable_skins)
         print(f"✅ Found {len(tradeable_skins)} tradeable skins")
         
         print("\n✅ All basic tests passed!")
@@ -50,4 +57,4 @@ async def test_imports():
         return False
 
 if __name__ == "__main__":
-    asyncio.run(test_imports())
+    run(test_imports())
@@ -3,7 +3,6 @@ Quick end-to-end test for the updated float scaling implementation
 Tests the complete workflow by running the main finder with very permissive parameters
 """
 
-import asyncio
 import sys
 from pathlib import Path
 
@@ -12,6 +11,7 @@ sys.path.insert(0, str(Path(__file__).parent / 'src'))
 
 from src.comprehensive_trade_finder import ComprehensiveTradeUpFinder
 from src.formatter import TradeUpFormatter
+from src.asyncio_setup import run
 
 async def test_quick_e2e():
     """Quick test of the complete workflow with float scaling"""
@@ -57,4 +57,4 @@ async def test_quick_e2e():
     print("\n=== Quick E2E Test Complete ===")
 
 if __name__ == "__main__":
-    asyncio.run(test_quick_e2e())
+    run(test_quick_e2e())
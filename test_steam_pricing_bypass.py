@@ -5,6 +5,7 @@ Test script to verify that Steam pricing bypasses validation correctly
 import asyncio
 import logging
 from src.comprehensive_trade_finder import ComprehensiveTradeUpFinder
+from src.asyncio_setup import run
 
 # Configure logging to see the validation process
 logging.basicConfig(level=logging.DEBUG)
@@ -14,15 +15,17 @@ async def test_steam_pricing_bypass():
     """Test that Steam pricing bypasses validation"""
     print("🔄 Testing Steam pricing validation bypass...")
     
-    # Test with Steam pricing enabled (should bypass validation)
+    # Both finders use separate state, so initialize them concurrently
     print("\n1. Testing with Steam pricing (should bypass validation):")
     steam_finder = ComprehensiveTradeUpFinder(use_steam_pricing=True)
-    await steam_finder.initialize(sample_size=50)  # Small sample for quick test
     
-    # Test with external pricing (should use validation)
     print("\n2. Testing with external pricing (should use validation):")
     external_finder = ComprehensiveTradeUpFinder(use_steam_pricing=False)
-    await external_finder.initialize(sample_size=50)  # Small sample for quick test
+    
+    await asyncio.gather(
+        steam_finder.initialize(sample_size=50),  # Small sample for quick test
+        external_finder.initialize(sample_size=50)
+    )
     
     print("\n✅ Test completed!")
     print("Check the debug logs above to verify:")
@@ -30,4 +33,4 @@ async def test_steam_pricing_bypass():
     print("- External pricing shows: 'Price validation complete: X/Y prices validated'")
 
 if __name__ == "__main__":
-    asyncio.run(test_steam_pricing_bypass())
+    run(test_steam_pricing_bypass())
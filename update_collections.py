@@ -6,66 +6,155 @@ by re-processing the raw_data field that's already stored
 
 import sqlite3
 import json
+import logging
 from pathlib import Path
 
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError, orjson.JSONDecodeError)
+except ImportError:  # orjson is optional; fall back to stdlib json
+    _json_loads = json.loads
+    _JSON_DECODE_ERRORS = (json.JSONDecodeError,)
+
+log = logging.getLogger(__name__)
+
+UPDATE_COLLECTION_SQL = "UPDATE comprehensive_skins SET collection = ? WHERE market_hash_name = ?"
+UPDATE_BATCH_SIZE = 5000
+
+# raw_data.collections[0].name, or NULL when raw_data isn't valid JSON
+COLLECTION_NAME_EXPR = "CASE WHEN json_valid(raw_data) THEN json_extract(raw_data, '$.collections[0].name') END"
+
+def has_json1(conn: sqlite3.Connection) -> bool:
+    """Check whether this SQLite build ships the JSON1 functions"""
+    try:
+        conn.execute("SELECT json_valid('{}')")
+        return True
+    except sqlite3.OperationalError:
+        return False
+
+def update_collections_in_sqlite(cursor: sqlite3.Cursor) -> dict:
+    """Copy the collection name out of raw_data with JSON1, entirely inside SQLite"""
+    # Tally per collection first, in the same statement shape as the update
+    cursor.execute(f"""
+        SELECT {COLLECTION_NAME_EXPR} AS name, COUNT(*)
+        FROM comprehensive_skins
+        WHERE raw_data IS NOT NULL
+        GROUP BY name
+        HAVING name IS NOT NULL AND name != ''
+        ORDER BY 2 DESC, 1
+    """)
+    collection_counts = dict(cursor.fetchall())
+    
+    cursor.execute(f"""
+        UPDATE comprehensive_skins
+        SET collection = {COLLECTION_NAME_EXPR}
+        WHERE raw_data IS NOT NULL
+        AND IFNULL({COLLECTION_NAME_EXPR}, '') != ''
+    """)
+    
+    cursor.execute("SELECT COUNT(*) FROM comprehensive_skins WHERE raw_data IS NOT NULL AND NOT json_valid(raw_data)")
+    invalid_count = cursor.fetchone()[0]
+    if invalid_count:
+        log.info("Skipped %d records with invalid raw_data JSON", invalid_count)
+    
+    return collection_counts
+
+def update_collections_in_python(cursor: sqlite3.Cursor) -> dict:
+    """Parse raw_data in Python; fallback for SQLite builds without JSON1"""
+    # Stream records with raw_data on their own cursor so `cursor` stays free for the UPDATEs
+    records = cursor.connection.cursor()
+    records.execute("SELECT market_hash_name, raw_data FROM comprehensive_skins WHERE raw_data IS NOT NULL")
+    
+    collection_counts = {}
+    pending = []  # (collection_name, market_hash_name) rows waiting to be written
+    error_count = 0
+    error_samples = []  # first few (market_hash_name, error) pairs, reported once at the end
+    
+    for market_hash_name, raw_data_str in records:
+        try:
+            raw_data = _json_loads(raw_data_str)
+        except (*_JSON_DECODE_ERRORS, TypeError) as e:
+            error_count += 1
+            if len(error_samples) < 5:
+                error_samples.append((market_hash_name, repr(e)))
+            continue
+        
+        # Extract collection name; a missing/empty/non-list collections field just means no collection
+        try:
+            collection_name = raw_data['collections'][0]['name']
+        except (KeyError, IndexError, TypeError):
+            continue
+        
+        if collection_name:
+            # Queue the collection field update
+            pending.append((collection_name, market_hash_name))
+            if len(pending) >= UPDATE_BATCH_SIZE:
+                cursor.executemany(UPDATE_COLLECTION_SQL, pending)
+                pending.clear()
+            collection_counts[collection_name] = collection_counts.get(collection_name, 0) + 1
+    
+    records.close()
+    if pending:
+        cursor.executemany(UPDATE_COLLECTION_SQL, pending)
+    
+    if error_count:
+        log.info("Skipped %d records with invalid raw_data JSON; samples: %s", error_count, error_samples)
+    
+    return collection_counts
+
 def update_collections():
     """Update collection information from existing raw_data"""
     
     db_path = Path("data/comprehensive_skins.db")
     if not db_path.exists():
-        print("Database not found!")
+        log.error("Database not found!")
         return
     
-    print("Updating collection information from existing raw data...")
+    log.info("Updating collection information from existing raw data...")
     
     conn = sqlite3.connect(db_path)
     cursor = conn.cursor()
     
-    # Get all records with raw_data
-    cursor.execute("SELECT market_hash_name, raw_data FROM comprehensive_skins WHERE raw_data IS NOT NULL")
-    records = cursor.fetchall()
+    # One-shot maintenance run that is safe to redo: WAL with NORMAL sync skips most fsyncs,
+    # plus a 64 MB page cache for the full-table pass
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA cache_size=-65536;
+        PRAGMA temp_store=MEMORY;
+    """)
     
-    print(f"Processing {len(records)} records...")
+    # Older databases may predate the builder's market_hash_name index; the per-row UPDATEs need it
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_market_hash_name ON comprehensive_skins(market_hash_name)")
+    cursor.execute("ANALYZE comprehensive_skins")
     
-    updated_count = 0
-    collection_counts = {}
+    cursor.execute("SELECT COUNT(*) FROM comprehensive_skins WHERE raw_data IS NOT NULL")
+    log.info("Processing %d records...", cursor.fetchone()[0])
     
-    for market_hash_name, raw_data_str in records:
-        try:
-            raw_data = json.loads(raw_data_str)
-            
-            # Extract collection name
-            collection_name = None
-            if 'collections' in raw_data and raw_data['collections']:
-                if isinstance(raw_data['collections'], list) and len(raw_data['collections']) > 0:
-                    collection_name = raw_data['collections'][0].get('name')
-            
-            if collection_name:
-                # Update the collection field
-                cursor.execute(
-                    "UPDATE comprehensive_skins SET collection = ? WHERE market_hash_name = ?",
-                    (collection_name, market_hash_name)
-                )
-                updated_count += 1
-                collection_counts[collection_name] = collection_counts.get(collection_name, 0) + 1
-        
-        except (json.JSONDecodeError, KeyError, TypeError) as e:
-            print(f"Error processing {market_hash_name}: {e}")
-            continue
+    # One explicit write transaction for the whole run, so the WAL checkpoints once at the end
+    conn.execute("BEGIN IMMEDIATE")
+    
+    if has_json1(conn):
+        collection_counts = update_collections_in_sqlite(cursor)
+    else:
+        collection_counts = update_collections_in_python(cursor)
+    updated_count = sum(collection_counts.values())
     
     # Commit changes
     conn.commit()
     
+    # Headline stays on stdout; the per-collection breakdown is verbose-only
     print(f"Updated {updated_count} records with collection information")
-    print(f"Found {len(collection_counts)} unique collections:")
+    log.info("Found %d unique collections:", len(collection_counts))
     
     # Show top collections
     sorted_collections = sorted(collection_counts.items(), key=lambda x: x[1], reverse=True)
     for collection, count in sorted_collections[:15]:
-        print(f"   {collection}: {count} skins")
+        log.info("   %s: %d skins", collection, count)
     
     if len(sorted_collections) > 15:
-        print(f"   ... and {len(sorted_collections) - 15} more collections")
+        log.info("   ... and %d more collections", len(sorted_collections) - 15)
     
     # Verify the update
     cursor.execute("SELECT COUNT(*) FROM comprehensive_skins WHERE collection IS NOT NULL AND collection != 'Unknown'")
@@ -81,4 +170,13 @@ def update_collections():
     print("Collection update complete!")
 
 if __name__ == "__main__":
+    import argparse
+    
+    parser = argparse.ArgumentParser(description='Update collection information from existing raw_data')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Log progress and the per-collection breakdown')
+    args = parser.parse_args()
+    
+    # Plain messages on the console; src.logging_config is avoided since importing src needs API keys
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING, format='%(message)s')
     update_collections()
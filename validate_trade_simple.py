@@ -6,10 +6,41 @@ Shows trade-up details with price validation from comprehensive database
 import asyncio
 import sys
 import os
-sys.path.append('src')
+from collections import Counter
+
+import numpy as np
 
 from src.comprehensive_trade_finder import ComprehensiveTradeUpFinder
 
+# Report rules, built once
+BANNER = '=' * 80
+SECTION_RULE = '-' * 50
+
+# Per-skin and per-output report blocks, each filled with one format_map call
+SKIN_TEMPLATE = (
+    "🔧 {count}x {name}\n"
+    "   Collection: {collection}\n"
+    "   Rarity: {rarity}\n"
+    "   Price: ${price:.2f} each = ${item_total:.2f} total\n"
+    "   Float Range: {float_min:.3f} - {float_max:.3f}"
+)
+OUTPUT_TEMPLATE = (
+    "{status_icon} {name}\n"
+    "   Collection: {collection}\n"
+    "   Value: ${price:.2f}\n"
+    "   Probability: {probability:.1%}\n"
+    "   Expected Value: ${expected_value:.2f}\n"
+    "   {status}\n"
+    "   Float Range: {float_min:.3f} - {float_max:.3f}\n"
+)
+
+# (icon, status template) per outcome, indexed by sign(profit) + 1: loss, break-even, profit
+OUTCOME_STATUS = (
+    ("❌", "Loss: ${:.2f}"),
+    ("⚖️", "Break-even"),
+    ("✅", "Profit: ${:.2f}"),
+)
+
 async def main():
     print('🔄 Initializing CS2 Trade-up Validator...')
     
@@ -26,13 +57,16 @@ async def main():
     # Get the first profitable trade-up
     print('\n🔍 Searching for profitable trades...')
     try:
-        profitable_trades = await finder.find_profitable_trades(min_profit=1.0, limit=1)
+        # Only the first hit is needed, so stop the search as soon as one turns up
+        first_trade = None
+        async for trade in finder.iter_profitable_trades(min_profit=1.0):
+            first_trade = trade
+            break
         
-        if not profitable_trades:
+        if first_trade is None:
             print('❌ No profitable trades found')
             return
             
-        first_trade = profitable_trades[0]
         print(f'✅ Found profitable trade')
         print(f'   Total cost: ${first_trade.input_config.total_cost:.2f}')
         print(f'   Expected profit: ${first_trade.expected_profit:.2f}')
@@ -42,148 +76,152 @@ async def main():
         print(f'❌ Error finding trades: {e}')
         return
     
-    # Show detailed trade analysis
-    print('\n' + '='*80)
-    print('                     TRADE-UP VALIDATION REPORT')
-    print('='*80)
+    # Group skins by type for display
+    input_skins = first_trade.input_config.skins
+    skin_counts = Counter(skin.name for skin in input_skins)
+    
+    # Start the DB lookups for every unique name now (2 queries instead of 2 per name) on worker
+    # threads; they are only awaited once the per-skin section needs them
+    unique_names = list(skin_counts)
+    lookups = asyncio.gather(
+        asyncio.to_thread(finder.db_manager.get_skins_by_names, unique_names),
+        asyncio.to_thread(finder.db_manager.get_price_validation_statuses, unique_names)
+    )
+    
+    # Show detailed trade analysis; the report is collected and written in one go
+    lines = []
+    lines.append('\n' + BANNER)
+    lines.append('                     TRADE-UP VALIDATION REPORT')
+    lines.append(BANNER)
     
     # Input analysis
-    print('\n📋 INPUT REQUIREMENTS:')
-    print('-' * 50)
+    lines.append('\n📋 INPUT REQUIREMENTS:')
+    lines.append(SECTION_RULE)
     
-    # Group skins by type for display
-    skin_counts = {}
-    total_cost = 0
+    # One representative per name (the first seen) for the static details
+    representatives = {skin.name: skin for skin in reversed(input_skins)}
+    unit_prices = {name: skin.price_f for name, skin in representatives.items()}
+    # The trade already carries its total; no need to re-sum the inputs
+    total_cost = float(first_trade.input_config.total_cost)
     
-    for skin in first_trade.input_config.skins:
-        if skin.name in skin_counts:
-            skin_counts[skin.name]['count'] += 1
-        else:
-            skin_counts[skin.name] = {
-                'count': 1,
-                'price': float(skin.price),
-                'collection': skin.collection,
-                'rarity': skin.rarity,
-                'float_range': f"{skin.float_min:.3f} - {skin.float_max:.3f}"
-            }
-    
-    for name, info in skin_counts.items():
-        item_total = info['count'] * info['price']
-        total_cost += item_total
+    known_skins, validation_statuses = await lookups
+    
+    for name, count in skin_counts.items():
+        skin = representatives[name]
+        price = unit_prices[name]
+        item_total = count * price
         
-        print(f"🔧 {info['count']}x {name}")
-        print(f"   Collection: {info['collection']}")
-        print(f"   Rarity: {info['rarity']}")
-        print(f"   Price: ${info['price']:.2f} each = ${item_total:.2f} total")
-        print(f"   Float Range: {info['float_range']}")
+        lines.append(SKIN_TEMPLATE.format_map({
+            'count': count, 'name': name, 'collection': skin.collection, 'rarity': skin.rarity,
+            'price': price, 'item_total': item_total,
+            'float_min': skin.float_min, 'float_max': skin.float_max
+        }))
           # Check price validation status
-        skin_data = finder.db_manager.get_skin_by_name(name)
-        if skin_data:
-            validation_status = finder.db_manager.get_price_validation_status(name)
+        if name in known_skins:
+            validation_status = validation_statuses.get(name)
             if validation_status:
                 status = validation_status.get('status', 'unvalidated')
                 if status == 'valid':
-                    print(f"   ✅ Price validated")
+                    lines.append(f"   ✅ Price validated")
                 elif status == 'invalid':
                     discrepancy = validation_status.get('discrepancy_percent')
                     if discrepancy is not None:
-                        print(f"   ⚠️  Price validation: {discrepancy:.1f}% discrepancy detected")
+                        lines.append(f"   ⚠️  Price validation: {discrepancy:.1f}% discrepancy detected")
                     else:
-                        print(f"   ⚠️  Price validation: Invalid (excluded from analysis)")
+                        lines.append(f"   ⚠️  Price validation: Invalid (excluded from analysis)")
                 else:
-                    print(f"   ⏳ Price validation: {status}")
+                    lines.append(f"   ⏳ Price validation: {status}")
             else:
-                print(f"   ❓ Price validation: Not checked")
-        print()
+                lines.append(f"   ❓ Price validation: Not checked")
+        lines.append("")
     
-    print(f"💰 TOTAL INVESTMENT: ${total_cost:.2f}")
-    print(f"📊 AVERAGE INPUT FLOAT: {first_trade.input_config.average_float:.6f}")
+    lines.append(f"💰 TOTAL INVESTMENT: ${total_cost:.2f}")
+    lines.append(f"📊 AVERAGE INPUT FLOAT: {first_trade.input_config.average_float:.6f}")
     
     # Output analysis
-    print('\n🎯 POSSIBLE OUTPUTS:')
-    print('-' * 50)
-    
-    expected_value = 0
-    profitable_outcomes = 0
-    break_even_outcomes = 0
-    losing_outcomes = 0
-    
-    for output in first_trade.output_skins:
-        profit = float(output.skin.price) - total_cost
-        expected_value += float(output.expected_value)
-        
-        if profit > 0:
-            profitable_outcomes += 1
-            status_icon = "✅"
-            status = f"Profit: ${profit:.2f}"
-        elif profit == 0:
-            break_even_outcomes += 1
-            status_icon = "⚖️"
-            status = "Break-even"
-        else:
-            losing_outcomes += 1
-            status_icon = "❌"
-            status = f"Loss: ${abs(profit):.2f}"
+    lines.append('\n🎯 POSSIBLE OUTPUTS:')
+    lines.append(SECTION_RULE)
+    
+    # Outcome arithmetic and statistics in one vectorized pass over the outputs
+    output_skins = first_trade.output_skins
+    output_prices = np.fromiter((output.skin.price_f for output in output_skins),
+                                dtype=np.float64, count=len(output_skins))
+    output_evs = np.fromiter((float(output.expected_value) for output in output_skins),
+                             dtype=np.float64, count=len(output_skins))
+    profits = output_prices - total_cost
+    
+    expected_value = float(output_evs.sum())
+    profitable_outcomes = int(np.count_nonzero(profits > 0))
+    break_even_outcomes = int(np.count_nonzero(profits == 0))
+    losing_outcomes = int(np.count_nonzero(profits < 0))
+    
+    status_indices = (np.sign(profits) + 1).astype(np.intp).tolist()
+    
+    for output, profit, status_index in zip(output_skins, profits.tolist(), status_indices):
+        status_icon, status_template = OUTCOME_STATUS[status_index]
+        status = status_template.format(abs(profit))
         
-        print(f"{status_icon} {output.skin.name}")
-        print(f"   Collection: {output.skin.collection}")
-        print(f"   Value: ${output.skin.price:.2f}")
-        print(f"   Probability: {output.probability:.1%}")
-        print(f"   Expected Value: ${output.expected_value:.2f}")
-        print(f"   {status}")
-        print(f"   Float Range: {output.skin.float_min:.3f} - {output.skin.float_max:.3f}")
-        print()
+        lines.append(OUTPUT_TEMPLATE.format_map({
+            'status_icon': status_icon, 'name': output.skin.name, 'collection': output.skin.collection,
+            'price': output.skin.price, 'probability': output.probability,
+            'expected_value': output.expected_value, 'status': status,
+            'float_min': output.skin.float_min, 'float_max': output.skin.float_max
+        }))
     
     # Financial summary
-    print('\n💵 FINANCIAL ANALYSIS:')
-    print('-' * 50)
-    print(f"Total Investment: ${total_cost:.2f}")
-    print(f"Expected Return: ${expected_value:.2f}")
-    print(f"Expected Profit: ${first_trade.expected_profit:.2f}")
-    print(f"ROI: {first_trade.roi_percentage:.1f}%")
-    print(f"Market Fee (15%): Already deducted from expected return")
+    lines.append('\n💵 FINANCIAL ANALYSIS:')
+    lines.append(SECTION_RULE)
+    lines.append(f"Total Investment: ${total_cost:.2f}")
+    lines.append(f"Expected Return: ${expected_value:.2f}")
+    lines.append(f"Expected Profit: ${first_trade.expected_profit:.2f}")
+    lines.append(f"ROI: {first_trade.roi_percentage:.1f}%")
+    lines.append(f"Market Fee (15%): Already deducted from expected return")
     
     # Outcome statistics
-    print('\n📊 OUTCOME STATISTICS:')
-    print('-' * 50)
+    lines.append('\n📊 OUTCOME STATISTICS:')
+    lines.append(SECTION_RULE)
     total_outcomes = len(first_trade.output_skins)
-    print(f"Total possible outcomes: {total_outcomes}")
-    print(f"Profitable outcomes: {profitable_outcomes} ({profitable_outcomes/total_outcomes:.1%})")
-    print(f"Break-even outcomes: {break_even_outcomes} ({break_even_outcomes/total_outcomes:.1%})")
-    print(f"Losing outcomes: {losing_outcomes} ({losing_outcomes/total_outcomes:.1%})")
+    # One division shared by all the shares below; a trade with no outputs reports 0%
+    inv_total = 1.0 / total_outcomes if total_outcomes else 0.0
+    lines.append(f"Total possible outcomes: {total_outcomes}")
+    lines.append(f"Profitable outcomes: {profitable_outcomes} ({profitable_outcomes * inv_total:.1%})")
+    lines.append(f"Break-even outcomes: {break_even_outcomes} ({break_even_outcomes * inv_total:.1%})")
+    lines.append(f"Losing outcomes: {losing_outcomes} ({losing_outcomes * inv_total:.1%})")
     
     # Risk assessment
-    print('\n⚠️  RISK ASSESSMENT:')
-    print('-' * 50)
+    lines.append('\n⚠️  RISK ASSESSMENT:')
+    lines.append(SECTION_RULE)
     if first_trade.guaranteed_profit:
-        print("✅ GUARANTEED PROFIT - All outcomes are profitable!")
+        lines.append("✅ GUARANTEED PROFIT - All outcomes are profitable!")
     else:
-        loss_probability = losing_outcomes / total_outcomes
+        loss_probability = losing_outcomes * inv_total
         if loss_probability > 0.5:
-            print(f"🔴 HIGH RISK - {loss_probability:.1%} chance of loss")
+            lines.append(f"🔴 HIGH RISK - {loss_probability:.1%} chance of loss")
         elif loss_probability > 0.3:
-            print(f"🟡 MEDIUM RISK - {loss_probability:.1%} chance of loss")
+            lines.append(f"🟡 MEDIUM RISK - {loss_probability:.1%} chance of loss")
         else:
-            print(f"🟢 LOW RISK - {loss_probability:.1%} chance of loss")
+            lines.append(f"🟢 LOW RISK - {loss_probability:.1%} chance of loss")
     
     # Execution instructions
-    print('\n🎯 EXECUTION STEPS:')
-    print('-' * 50)
-    print("1. Purchase the required input skins from Steam Market:")
-    for name, info in skin_counts.items():
-        print(f"   • Buy {info['count']}x {name} at ~${info['price']:.2f} each")
-    print()
-    print("2. Ensure all items are in your CS2 inventory")
-    print("3. Open CS2 and navigate to the Trade-up Contract")
-    print("4. Add the 10 items to the contract")
-    print("5. Execute the trade-up")
-    print("6. Sell the resulting item on Steam Market")
-    print()
-    print("💡 TIP: Consider the market volatility and ensure prices haven't changed significantly before executing!")
-    
-    print('\n' + '='*80)
-    print('                     VALIDATION COMPLETE')
-    print('='*80)
+    lines.append('\n🎯 EXECUTION STEPS:')
+    lines.append(SECTION_RULE)
+    lines.append("1. Purchase the required input skins from Steam Market:")
+    for name, count in skin_counts.items():
+        lines.append(f"   • Buy {count}x {name} at ~${unit_prices[name]:.2f} each")
+    lines.append("")
+    lines.append("2. Ensure all items are in your CS2 inventory")
+    lines.append("3. Open CS2 and navigate to the Trade-up Contract")
+    lines.append("4. Add the 10 items to the contract")
+    lines.append("5. Execute the trade-up")
+    lines.append("6. Sell the resulting item on Steam Market")
+    lines.append("")
+    lines.append("💡 TIP: Consider the market volatility and ensure prices haven't changed significantly before executing!")
+    
+    lines.append('\n' + BANNER)
+    lines.append('                     VALIDATION COMPLETE')
+    lines.append(BANNER)
+    
+    sys.stdout.write("\n".join(lines) + "\n")
     
     # Close resources
     await finder.close()
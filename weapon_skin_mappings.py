@@ -2,295 +2,316 @@
 # Total weapons: 30
 # Total unique skins: 224
 
+import sys
+from collections import defaultdict
+
+# Shared placeholder for skins whose collection and rarity are not filled in yet
+_UNK = ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY")
+
 WEAPON_SKIN_MAPPINGS = {
 
     # AK-47 Skins
-    "AK-47 | Aquamarine Revenge": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Asiimov": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Bloodsport": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Case Hardened": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Fire Serpent": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Frontside Misty": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Inheritance": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Legion of Anubis": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Neon Rider": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Phantom Disruptor": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Point Disarray": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Redline": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Slate": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | The Empress": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Vulcan": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AK-47 | Wasteland Rebel": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "AK-47 | Aquamarine Revenge": _UNK,
+    "AK-47 | Asiimov": _UNK,
+    "AK-47 | Bloodsport": _UNK,
+    "AK-47 | Case Hardened": _UNK,
+    "AK-47 | Fire Serpent": _UNK,
+    "AK-47 | Frontside Misty": _UNK,
+    "AK-47 | Inheritance": _UNK,
+    "AK-47 | Legion of Anubis": _UNK,
+    "AK-47 | Neon Rider": _UNK,
+    "AK-47 | Phantom Disruptor": _UNK,
+    "AK-47 | Point Disarray": _UNK,
+    "AK-47 | Redline": _UNK,
+    "AK-47 | Slate": _UNK,
+    "AK-47 | The Empress": _UNK,
+    "AK-47 | Vulcan": _UNK,
+    "AK-47 | Wasteland Rebel": _UNK,
 
     # AUG Skins
-    "AUG | Akihabara Accept": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AUG | Bengal Tiger": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AUG | Chameleon": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AUG | Flame Jörmungandr": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AUG | Hot Rod": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AUG | Syd Mead": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "AUG | Akihabara Accept": _UNK,
+    "AUG | Bengal Tiger": _UNK,
+    "AUG | Chameleon": _UNK,
+    "AUG | Flame Jörmungandr": _UNK,
+    "AUG | Hot Rod": _UNK,
+    "AUG | Syd Mead": _UNK,
 
     # AWP Skins
-    "AWP | Asiimov": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | BOOM": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | Chromatic Aberration": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | Containment Breach": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | Dragon Lore": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | Electric Hive": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | Fade": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | Gungnir": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | Hyper Beast": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | Lightning Strike": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | Man-o'-war": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | Neo-Noir": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | Oni Taiji": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | Redline": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | The Prince": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "AWP | Wildfire": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "AWP | Asiimov": _UNK,
+    "AWP | BOOM": _UNK,
+    "AWP | Chromatic Aberration": _UNK,
+    "AWP | Containment Breach": _UNK,
+    "AWP | Dragon Lore": _UNK,
+    "AWP | Electric Hive": _UNK,
+    "AWP | Fade": _UNK,
+    "AWP | Gungnir": _UNK,
+    "AWP | Hyper Beast": _UNK,
+    "AWP | Lightning Strike": _UNK,
+    "AWP | Man-o'-war": _UNK,
+    "AWP | Neo-Noir": _UNK,
+    "AWP | Oni Taiji": _UNK,
+    "AWP | Redline": _UNK,
+    "AWP | The Prince": _UNK,
+    "AWP | Wildfire": _UNK,
 
     # CZ75-Auto Skins
-    "CZ75-Auto | Chalice": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "CZ75-Auto | Emerald Quartz": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "CZ75-Auto | Red Astor": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "CZ75-Auto | The Fuschia Is Now": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "CZ75-Auto | Victoria": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "CZ75-Auto | Xiangliu": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "CZ75-Auto | Chalice": _UNK,
+    "CZ75-Auto | Emerald Quartz": _UNK,
+    "CZ75-Auto | Red Astor": _UNK,
+    "CZ75-Auto | The Fuschia Is Now": _UNK,
+    "CZ75-Auto | Victoria": _UNK,
+    "CZ75-Auto | Xiangliu": _UNK,
 
     # Desert Eagle Skins
-    "Desert Eagle | Blaze": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Desert Eagle | Cobalt Disruption": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Desert Eagle | Code Red": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Desert Eagle | Conspiracy": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Desert Eagle | Golden Koi": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Desert Eagle | Hypnotic": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Desert Eagle | Kumicho Dragon": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Desert Eagle | Mecha Industries": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Desert Eagle | Printstream": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "Desert Eagle | Blaze": _UNK,
+    "Desert Eagle | Cobalt Disruption": _UNK,
+    "Desert Eagle | Code Red": _UNK,
+    "Desert Eagle | Conspiracy": _UNK,
+    "Desert Eagle | Golden Koi": _UNK,
+    "Desert Eagle | Hypnotic": _UNK,
+    "Desert Eagle | Kumicho Dragon": _UNK,
+    "Desert Eagle | Mecha Industries": _UNK,
+    "Desert Eagle | Printstream": _UNK,
 
     # FAMAS Skins
-    "FAMAS | Afterimage": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "FAMAS | Djinn": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "FAMAS | Eye of Athena": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "FAMAS | Neural Net": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "FAMAS | Roll Cage": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "FAMAS | Valence": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "FAMAS | Afterimage": _UNK,
+    "FAMAS | Djinn": _UNK,
+    "FAMAS | Eye of Athena": _UNK,
+    "FAMAS | Neural Net": _UNK,
+    "FAMAS | Roll Cage": _UNK,
+    "FAMAS | Valence": _UNK,
 
     # Five-SeveN Skins
-    "Five-SeveN | Case Hardened": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Five-SeveN | Copper Galaxy": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Five-SeveN | Fowl Play": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Five-SeveN | Hyper Beast": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Five-SeveN | Monkey Business": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Five-SeveN | Retrobution": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "Five-SeveN | Case Hardened": _UNK,
+    "Five-SeveN | Copper Galaxy": _UNK,
+    "Five-SeveN | Fowl Play": _UNK,
+    "Five-SeveN | Hyper Beast": _UNK,
+    "Five-SeveN | Monkey Business": _UNK,
+    "Five-SeveN | Retrobution": _UNK,
 
     # G3SG1 Skins
-    "G3SG1 | Azure Zebra": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "G3SG1 | Chronos": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "G3SG1 | Dream Glade": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "G3SG1 | Flux": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "G3SG1 | Scavenger": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "G3SG1 | The Executioner": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "G3SG1 | Azure Zebra": _UNK,
+    "G3SG1 | Chronos": _UNK,
+    "G3SG1 | Dream Glade": _UNK,
+    "G3SG1 | Flux": _UNK,
+    "G3SG1 | Scavenger": _UNK,
+    "G3SG1 | The Executioner": _UNK,
 
     # Galil AR Skins
-    "Galil AR | Cerberus": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Galil AR | Chatterbox": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Galil AR | Chromatic Aberration": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Galil AR | Eco": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Galil AR | Phoenix Blacklight": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Galil AR | Stone Cold": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "Galil AR | Cerberus": _UNK,
+    "Galil AR | Chatterbox": _UNK,
+    "Galil AR | Chromatic Aberration": _UNK,
+    "Galil AR | Eco": _UNK,
+    "Galil AR | Phoenix Blacklight": _UNK,
+    "Galil AR | Stone Cold": _UNK,
 
     # Glock-18 Skins
-    "Glock-18 | Bullet Queen": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Glock-18 | Dragon Tattoo": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Glock-18 | Fade": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Glock-18 | Moonrise": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Glock-18 | Neo-Noir": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Glock-18 | Twilight Galaxy": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Glock-18 | Vogue": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Glock-18 | Wasteland Rebel": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Glock-18 | Water Elemental": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "Glock-18 | Bullet Queen": _UNK,
+    "Glock-18 | Dragon Tattoo": _UNK,
+    "Glock-18 | Fade": _UNK,
+    "Glock-18 | Moonrise": _UNK,
+    "Glock-18 | Neo-Noir": _UNK,
+    "Glock-18 | Twilight Galaxy": _UNK,
+    "Glock-18 | Vogue": _UNK,
+    "Glock-18 | Wasteland Rebel": _UNK,
+    "Glock-18 | Water Elemental": _UNK,
 
     # M249 Skins
-    "M249 | Aztec": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M249 | Deep Relief": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M249 | Emerald Poison Dart": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M249 | Jungle DDPAT": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M249 | Spectre": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M249 | System Lock": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "M249 | Aztec": _UNK,
+    "M249 | Deep Relief": _UNK,
+    "M249 | Emerald Poison Dart": _UNK,
+    "M249 | Jungle DDPAT": _UNK,
+    "M249 | Spectre": _UNK,
+    "M249 | System Lock": _UNK,
 
     # M4A1-S Skins
-    "M4A1-S | Blue Phosphor": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A1-S | Chantico's Fire": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A1-S | Cyrex": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A1-S | Decimator": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A1-S | Golden Coil": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A1-S | Hot Rod": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A1-S | Hyper Beast": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A1-S | Icarus Fell": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A1-S | Knight": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A1-S | Mecha Industries": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A1-S | Player Two": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A1-S | Printstream": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "M4A1-S | Blue Phosphor": _UNK,
+    "M4A1-S | Chantico's Fire": _UNK,
+    "M4A1-S | Cyrex": _UNK,
+    "M4A1-S | Decimator": _UNK,
+    "M4A1-S | Golden Coil": _UNK,
+    "M4A1-S | Hot Rod": _UNK,
+    "M4A1-S | Hyper Beast": _UNK,
+    "M4A1-S | Icarus Fell": _UNK,
+    "M4A1-S | Knight": _UNK,
+    "M4A1-S | Mecha Industries": _UNK,
+    "M4A1-S | Player Two": _UNK,
+    "M4A1-S | Printstream": _UNK,
 
     # M4A4 Skins
-    "M4A4 | Asiimov": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A4 | Buzz Kill": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A4 | Desolate Space": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A4 | Dragon King": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A4 | Hellfire": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A4 | Howl": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A4 | Neo-Noir": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A4 | Royal Paladin": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A4 | Temukau": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A4 | The Emperor": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A4 | X-Ray": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "M4A4 | 龍王 (Dragon King)": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "M4A4 | Asiimov": _UNK,
+    "M4A4 | Buzz Kill": _UNK,
+    "M4A4 | Desolate Space": _UNK,
+    "M4A4 | Dragon King": _UNK,
+    "M4A4 | Hellfire": _UNK,
+    "M4A4 | Howl": _UNK,
+    "M4A4 | Neo-Noir": _UNK,
+    "M4A4 | Royal Paladin": _UNK,
+    "M4A4 | Temukau": _UNK,
+    "M4A4 | The Emperor": _UNK,
+    "M4A4 | X-Ray": _UNK,
+    "M4A4 | 龍王 (Dragon King)": _UNK,
 
     # MAC-10 Skins
-    "MAC-10 | Curse": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MAC-10 | Disco Tech": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MAC-10 | Fade": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MAC-10 | Heat": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MAC-10 | Neon Rider": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MAC-10 | Stalker": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "MAC-10 | Curse": _UNK,
+    "MAC-10 | Disco Tech": _UNK,
+    "MAC-10 | Fade": _UNK,
+    "MAC-10 | Heat": _UNK,
+    "MAC-10 | Neon Rider": _UNK,
+    "MAC-10 | Stalker": _UNK,
 
     # MAG-7 Skins
-    "MAG-7 | Bulldozer": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MAG-7 | Cinquedea": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MAG-7 | Counter Terrace": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MAG-7 | Heat": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MAG-7 | Justice": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MAG-7 | Prism Terrace": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "MAG-7 | Bulldozer": _UNK,
+    "MAG-7 | Cinquedea": _UNK,
+    "MAG-7 | Counter Terrace": _UNK,
+    "MAG-7 | Heat": _UNK,
+    "MAG-7 | Justice": _UNK,
+    "MAG-7 | Prism Terrace": _UNK,
 
     # MP7 Skins
-    "MP7 | Bloodsport": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MP7 | Fade": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MP7 | Impire": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MP7 | Nemesis": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MP7 | Skulls": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MP7 | Whiteout": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "MP7 | Bloodsport": _UNK,
+    "MP7 | Fade": _UNK,
+    "MP7 | Impire": _UNK,
+    "MP7 | Nemesis": _UNK,
+    "MP7 | Skulls": _UNK,
+    "MP7 | Whiteout": _UNK,
 
     # MP9 Skins
-    "MP9 | Bulldozer": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MP9 | Hot Rod": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MP9 | Hypnotic": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MP9 | Rose Iron": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MP9 | Starlight Protector": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "MP9 | Wild Lily": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "MP9 | Bulldozer": _UNK,
+    "MP9 | Hot Rod": _UNK,
+    "MP9 | Hypnotic": _UNK,
+    "MP9 | Rose Iron": _UNK,
+    "MP9 | Starlight Protector": _UNK,
+    "MP9 | Wild Lily": _UNK,
 
     # Negev Skins
-    "Negev | Dazzle": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Negev | Lionfish": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Negev | Loudmouth": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Negev | Man-o'-war": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Negev | Mjölnir": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Negev | Power Loader": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "Negev | Dazzle": _UNK,
+    "Negev | Lionfish": _UNK,
+    "Negev | Loudmouth": _UNK,
+    "Negev | Man-o'-war": _UNK,
+    "Negev | Mjölnir": _UNK,
+    "Negev | Power Loader": _UNK,
 
     # Nova Skins
-    "Nova | Antique": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Nova | Bloomstick": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Nova | Graphite": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Nova | Hyper Beast": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Nova | Koi": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Nova | Toy Soldier": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "Nova | Antique": _UNK,
+    "Nova | Bloomstick": _UNK,
+    "Nova | Graphite": _UNK,
+    "Nova | Hyper Beast": _UNK,
+    "Nova | Koi": _UNK,
+    "Nova | Toy Soldier": _UNK,
 
     # P250 Skins
-    "P250 | Asiimov": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P250 | Cartel": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P250 | Franklin": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P250 | Muertos": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P250 | Nuclear Threat": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P250 | See Ya Later": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P250 | Undertow": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P250 | Whiteout": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "P250 | Asiimov": _UNK,
+    "P250 | Cartel": _UNK,
+    "P250 | Franklin": _UNK,
+    "P250 | Muertos": _UNK,
+    "P250 | Nuclear Threat": _UNK,
+    "P250 | See Ya Later": _UNK,
+    "P250 | Undertow": _UNK,
+    "P250 | Whiteout": _UNK,
 
     # P90 Skins
-    "P90 | Asiimov": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P90 | Cold Blooded": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P90 | Death by Kitty": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P90 | Dragon King": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P90 | Emerald Dragon": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P90 | Nostalgia": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P90 | Shallow Grave": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "P90 | Trigon": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "P90 | Asiimov": _UNK,
+    "P90 | Cold Blooded": _UNK,
+    "P90 | Death by Kitty": _UNK,
+    "P90 | Dragon King": _UNK,
+    "P90 | Emerald Dragon": _UNK,
+    "P90 | Nostalgia": _UNK,
+    "P90 | Shallow Grave": _UNK,
+    "P90 | Trigon": _UNK,
 
     # PP-Bizon Skins
-    "PP-Bizon | Antique": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "PP-Bizon | Blue Streak": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "PP-Bizon | Fuel Rod": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "PP-Bizon | High Roller": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "PP-Bizon | Judgement of Anubis": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "PP-Bizon | Osiris": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "PP-Bizon | Antique": _UNK,
+    "PP-Bizon | Blue Streak": _UNK,
+    "PP-Bizon | Fuel Rod": _UNK,
+    "PP-Bizon | High Roller": _UNK,
+    "PP-Bizon | Judgement of Anubis": _UNK,
+    "PP-Bizon | Osiris": _UNK,
 
     # R8 Revolver Skins
-    "R8 Revolver | Amber Fade": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "R8 Revolver | Crimson Web": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "R8 Revolver | Fade": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "R8 Revolver | Grip": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "R8 Revolver | Llama Cannon": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "R8 Revolver | Survivalist": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "R8 Revolver | Amber Fade": _UNK,
+    "R8 Revolver | Crimson Web": _UNK,
+    "R8 Revolver | Fade": _UNK,
+    "R8 Revolver | Grip": _UNK,
+    "R8 Revolver | Llama Cannon": _UNK,
+    "R8 Revolver | Survivalist": _UNK,
 
     # SCAR-20 Skins
-    "SCAR-20 | Bloodsport": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "SCAR-20 | Cardiac": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "SCAR-20 | Crimson Web": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "SCAR-20 | Cyrex": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "SCAR-20 | Emerald": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "SCAR-20 | Fragments": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "SCAR-20 | Bloodsport": _UNK,
+    "SCAR-20 | Cardiac": _UNK,
+    "SCAR-20 | Crimson Web": _UNK,
+    "SCAR-20 | Cyrex": _UNK,
+    "SCAR-20 | Emerald": _UNK,
+    "SCAR-20 | Fragments": _UNK,
 
     # SG 553 Skins
-    "SG 553 | Atlas": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "SG 553 | Bulldozer": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "SG 553 | Cyrex": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "SG 553 | Danger Close": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "SG 553 | Dragon Tech": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "SG 553 | Integrale": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "SG 553 | Atlas": _UNK,
+    "SG 553 | Bulldozer": _UNK,
+    "SG 553 | Cyrex": _UNK,
+    "SG 553 | Danger Close": _UNK,
+    "SG 553 | Dragon Tech": _UNK,
+    "SG 553 | Integrale": _UNK,
 
     # Sawed-Off Skins
-    "Sawed-Off | Brake Light": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Sawed-Off | Limelight": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Sawed-Off | Orange DDPAT": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Sawed-Off | Serenity": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Sawed-Off | The Kraken": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Sawed-Off | Wasteland Princess": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "Sawed-Off | Brake Light": _UNK,
+    "Sawed-Off | Limelight": _UNK,
+    "Sawed-Off | Orange DDPAT": _UNK,
+    "Sawed-Off | Serenity": _UNK,
+    "Sawed-Off | The Kraken": _UNK,
+    "Sawed-Off | Wasteland Princess": _UNK,
 
     # Tec-9 Skins
-    "Tec-9 | Bamboozle": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Tec-9 | Fuel Injector": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Tec-9 | Ice Cap": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Tec-9 | Nuclear Threat": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Tec-9 | Red Quartz": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "Tec-9 | Titanium Bit": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "Tec-9 | Bamboozle": _UNK,
+    "Tec-9 | Fuel Injector": _UNK,
+    "Tec-9 | Ice Cap": _UNK,
+    "Tec-9 | Nuclear Threat": _UNK,
+    "Tec-9 | Red Quartz": _UNK,
+    "Tec-9 | Titanium Bit": _UNK,
 
     # UMP-45 Skins
-    "UMP-45 | Arctic Wolf": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "UMP-45 | Blaze": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "UMP-45 | Crime Scene": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "UMP-45 | Grand Prix": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "UMP-45 | Momentum": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "UMP-45 | Primal Saber": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "UMP-45 | Arctic Wolf": _UNK,
+    "UMP-45 | Blaze": _UNK,
+    "UMP-45 | Crime Scene": _UNK,
+    "UMP-45 | Grand Prix": _UNK,
+    "UMP-45 | Momentum": _UNK,
+    "UMP-45 | Primal Saber": _UNK,
 
     # USP-S Skins
-    "USP-S | Caiman": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "USP-S | Cortex": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "USP-S | Kill Confirmed": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "USP-S | Neo-Noir": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "USP-S | Orion": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "USP-S | Printstream": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "USP-S | Serum": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "USP-S | The Traitor": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "USP-S | Caiman": _UNK,
+    "USP-S | Cortex": _UNK,
+    "USP-S | Kill Confirmed": _UNK,
+    "USP-S | Neo-Noir": _UNK,
+    "USP-S | Orion": _UNK,
+    "USP-S | Printstream": _UNK,
+    "USP-S | Serum": _UNK,
+    "USP-S | The Traitor": _UNK,
 
     # XM1014 Skins
-    "XM1014 | Blaze Orange": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "XM1014 | Entombed": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "XM1014 | Seasons": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "XM1014 | Teclu Burner": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "XM1014 | Tranquility": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
-    "XM1014 | Zombie Offensive": ("UNKNOWN_COLLECTION", "UNKNOWN_RARITY"),
+    "XM1014 | Blaze Orange": _UNK,
+    "XM1014 | Entombed": _UNK,
+    "XM1014 | Seasons": _UNK,
+    "XM1014 | Teclu Burner": _UNK,
+    "XM1014 | Tranquility": _UNK,
+    "XM1014 | Zombie Offensive": _UNK,
 }
 
+# Derived lookups, built once at import. Names are interned so lookups with interned names
+# (sys.intern(raw_name)) hit on identity instead of comparing the full strings
+WEAPON_SKIN_MAPPINGS = {sys.intern(name): info for name, info in WEAPON_SKIN_MAPPINGS.items()}
+KNOWN_SKINS = frozenset(WEAPON_SKIN_MAPPINGS)  # for "is this a known skin?" checks
+SKIN_TO_WEAPON = {name: sys.intern(name.split(' | ', 1)[0]) for name in WEAPON_SKIN_MAPPINGS}
+
+# Inverted inside a function so no loop variables leak into the module (even when empty)
+def _group_by_weapon(skin_to_weapon):
+    weapon_to_skins = defaultdict(list)
+    for name, weapon in skin_to_weapon.items():
+        weapon_to_skins[weapon].append(name)
+    return {weapon: tuple(names) for weapon, names in weapon_to_skins.items()}
+
+WEAPON_TO_SKINS = _group_by_weapon(SKIN_TO_WEAPON)
+
 # Instructions:
-# 1. Replace 'UNKNOWN_COLLECTION' with the actual collection name (e.g., 'Chroma 2 Case')
-# 2. Replace 'UNKNOWN_RARITY' with the actual rarity (e.g., 'Mil-Spec Grade', 'Restricted', 'Classified', 'Covert', 'Contraband')
+# 1. Replace _UNK with a (collection, rarity) tuple for the skin
+# 2. Use the actual collection name (e.g., 'Chroma 2 Case') and rarity (e.g., 'Mil-Spec Grade', 'Restricted', 'Classified', 'Covert', 'Contraband')
 # 3. Research each skin to find its correct collection and rarity
 # 4. Update the main skin_mapping.py file with these mappings